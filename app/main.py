@@ -8,7 +8,8 @@ Este módulo:
 
 Dependencias clave (paquete `function.*`):
 - init.init_db: Inicialización de la base de datos/archivos.
-- data_load.leer_csv / escribir_csv: Carga y persistencia de autos.
+- tools.leer_csv / escribir_csv / append_csv: Carga y persistencia de autos.
+- backend.LocalBackend / ApiBackend: Operaciones del menú para cada modo.
 - view, statistics, tools, shearch, api_client, api_mode: Menús, filtros, vistas,
   utilidades y llamadas a API.
 
@@ -18,6 +19,8 @@ Nota:
 
 import sys
 import os
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 
 script_path = os.path.abspath(__file__)
 app_dir = os.path.dirname(script_path)
@@ -29,15 +32,14 @@ if project_root not in sys.path:
 if src_dir not in sys.path:
         sys.path.append(src_dir)
 
+# Solo se importa lo que usa este módulo: los filtros, vistas y estadísticas
+# llegan a través de `function.backend`, y `api_client` carga `requests` recién
+# al hacer la primera petición (modo API).
 try:
         from function.init import init_db
-        from function.view import *
-        from function.statistics import *
         from function.tools import *
-        from function.data_load import *
-        from function.shearch import *
         from function import api_client
-        from function.api_mode import *
+        from function.backend import LocalBackend, ApiBackend
 
 except ImportError:
         print(f"Error: No se pudo importar módulos desde 'function'.")
@@ -48,10 +50,22 @@ db_path = init_db(project_root)
 if db_path is None:
         sys.exit(1)
 
-autos = leer_csv(db_path)
+# El CSV se lee en segundo plano mientras el usuario elige el modo; el backend
+# local espera el resultado recién cuando una opción necesita los autos.
+# Los avisos de filas inválidas se juntan y se muestran recién entonces, para
+# no mezclarlos con el menú de selección de modo.
+_avisos_carga = []
+_cargador = ThreadPoolExecutor(max_workers=1)
+_autos_futuro = _cargador.submit(leer_csv, db_path, _avisos_carga)
+_cargador.shutdown(wait=False)
 
-# Indicador global de modo de operación. False = local, True = API.
-MODO_API = False
+# Fuente de datos del menú principal. Se elige una sola vez en `elegir_modo`;
+# el backend local se conserva entre cambios de modo.
+BACKEND_LOCAL = LocalBackend(_autos_futuro, db_path, avisos=_avisos_carga)
+BACKEND = BACKEND_LOCAL
+
+# Las ediciones y bajas locales se acumulan; se persisten también al salir.
+atexit.register(BACKEND_LOCAL.guardar_pendientes)
 
 
 def elegir_modo():
@@ -60,16 +74,18 @@ def elegir_modo():
         El flujo de trabajo es:
         1) Mostrar un selector (ver `seleccion()`).
         2) Cuando la opción es válida:
-           - Opción 1: modo local (MODO_API=False), se limpia consola y ejecuta
-             `local()`; luego continúa al menú principal.
-           - Opción 2: modo API (MODO_API=True), se limpia consola, verifica
-             `api_client.estado_servidor()`, ejecuta `nube()` y continúa al menú principal.
+           - Opción 1: modo local (BACKEND=BACKEND_LOCAL), se limpia consola y
+             ejecuta `local()`; luego continúa al menú principal.
+           - Opción 2: modo API, se limpia consola y verifica el servidor con
+             `api_client.ping()`; si responde, pasa a BACKEND=ApiBackend(), empieza
+             a descargar el catálogo en segundo plano, ejecuta `nube()` y continúa
+             al menú principal.
            - Opción 3: salir del programa (`salida()` y `sys.exit(0)`).
         3) En caso de error de tipeo o excepción controlada se limpia la consola y
            se informa el problema, repitiendo el bucle hasta una selección válida.
 
         Side effects:
-            - Cambia el estado global `MODO_API`.
+            - Cambia el backend global `BACKEND`.
             - Imprime y limpia la consola.
             - Puede finalizar el proceso con `sys.exit(0)` si se elige salir.
 
@@ -77,12 +93,12 @@ def elegir_modo():
             None
         """
         while True:
-                global MODO_API
+                global BACKEND
                 try:
                         op = seleccion()
                         match op:
                                 case 1:
-                                        MODO_API = False
+                                        BACKEND = BACKEND_LOCAL
                                         try:
                                                 limpiar_consola()
                                                 local()
@@ -91,15 +107,13 @@ def elegir_modo():
                                                 limpiar_consola()
                                                 except_local(c)
                                 case 2:
-                                        MODO_API = True
-                                        try:
-                                                limpiar_consola()
-                                                api_client.estado_servidor()
+                                        limpiar_consola()
+                                        if api_client.ping():
+                                                BACKEND = ApiBackend()
+                                                api_client.precargar_autos()
                                                 nube()
                                                 break
-                                        except Exception as b:
-                                                limpiar_consola()
-                                                error_server()
+                                        error_server()
                                 case 3:
                                         limpiar_consola()
                                         salida()
@@ -115,11 +129,105 @@ def elegir_modo():
 elegir_modo()
 
 
+def pedir_no_vacio(mensaje, aviso_vacio):
+        """Pide un texto por consola hasta que el usuario ingrese algo.
+
+        Args:
+            mensaje (str): Texto a mostrar al pedir el dato.
+            aviso_vacio (str): Aviso a mostrar si la respuesta está vacía.
+
+        Returns:
+            str: Texto ingresado, sin espacios extremos.
+        """
+        while True:
+                try:
+                        texto = leer(mensaje).strip()
+                        if not texto:
+                                print(aviso_vacio)
+                                continue
+                        return texto
+                except Exception:
+                        print("Intente nuevamente, algo salio mal.")
+
+
+def pedir_busqueda():
+        """Pide la marca o modelo a buscar (opción 1)."""
+        return pedir_no_vacio(
+                "Ingrese la marca o modelo del auto (o parte): ",
+                "La búsqueda no puede estar vacía.",
+        )
+
+
+def pedir_combustible():
+        """Pide el tipo de combustible a filtrar (opción 2)."""
+        return pedir_no_vacio(
+                "Ingrese el tipo de combustible: ",
+                "El tipo de combustible no puede estar vacío.",
+        )
+
+
+def pedir_transmision():
+        """Pide el tipo de transmisión a filtrar (opción 4)."""
+        return pedir_no_vacio(
+                "Ingrese el tipo de transmisión (Manual/Automática): ",
+                "La transmisión no puede estar vacía.",
+        )
+
+
+def pedir_orden():
+        """Pide el campo y el sentido de ordenamiento (opción 5).
+
+        Returns:
+            tuple[str, bool]: Campo en minúsculas y True si es descendente.
+        """
+        while True:
+                campo = leer(
+                        "Campo para ordenar (marca/modelo/año/tipocombustible/transmision): "
+                ).strip().lower()
+                if campo:
+                        break
+                print("Campo inválido.")
+
+        while True:
+                desc_input = leer(
+                        "¿Querés orden descendente? (s/n): "
+                ).strip().lower()
+                if desc_input in {"s", "n"}:
+                        break
+                print("Responda con 's' para sí o 'n' para no.")
+        return campo, desc_input == "s"
+
+
+def cambiar_modo():
+        """Persiste los cambios pendientes del backend actual y vuelve a elegir el modo."""
+        BACKEND.guardar_pendientes()
+        elegir_modo()
+
+
+# Operaciones del menú principal (opciones 1 a 11). Cada operación pide sus
+# propios datos por consola y delega en el backend elegido con `elegir_modo`.
+OPS = {
+        1: lambda: BACKEND.buscar(pedir_busqueda()),
+        2: lambda: BACKEND.filtrar_combustible(pedir_combustible()),
+        3: lambda: BACKEND.filtrar_año(),
+        4: lambda: BACKEND.filtrar_transmision(pedir_transmision()),
+        5: lambda: BACKEND.ordenar(*pedir_orden()),
+        6: lambda: BACKEND.estadisticas(),
+        7: lambda: BACKEND.agregar(),
+        8: lambda: BACKEND.editar(),
+        9: lambda: BACKEND.borrar(),
+        10: cambiar_modo,
+        11: lambda: BACKEND.agregar_varios(),
+}
+
+OPCION_SALIR = 12
+
+
 def main():
         """Bucle principal del programa que despacha el menú de opciones.
 
-        Según el modo actual (`MODO_API`), las operaciones se ejecutan contra el
-        backend local (listas/CSV) o invocan endpoints del servidor (API).
+        Cada opción se resuelve en la tabla `OPS`, que delega en el backend
+        elegido (`LocalBackend` para listas/CSV o `ApiBackend` para el servidor).
 
         Opciones principales:
             1. Buscar auto por marca o modelo.
@@ -132,12 +240,14 @@ def main():
             8. Editar auto (persiste en CSV en modo local).
             9. Borrar auto (persiste en CSV en modo local si procede).
             10. Cambiar modo (Local/API).
-            11. Salir.
+            11. Agregar varios autos (en modo API se envían en un solo pedido).
+            12. Salir.
 
         Side effects:
             - Lectura/escritura por consola.
             - Modificación de la lista `autos` en memoria (modo local).
-            - Persistencia a disco vía `escribir_csv` (altas/bajas/modificaciones).
+            - Persistencia a disco en modo local: altas vía `append_csv`; ediciones
+              y bajas acumuladas y escritas por lotes por `LocalBackend`.
             - Impresiones/limpieza de pantalla con utilidades de `view/tools`.
 
         Returns:
@@ -146,127 +256,17 @@ def main():
         while True:
                 try:
                         opcion = menu_principal()
-                        match opcion:
-                                case 1:
-                                        limpiar_consola()
-                                        while True:
-                                                try:
-                                                        busqueda = input(
-                                                                "Ingrese la marca o modelo del auto (o parte): "
-                                                        ).strip()
-                                                        if not busqueda:
-                                                                print("La búsqueda no puede estar vacía.")
-                                                                continue
-                                                        break
-                                                except Exception:
-                                                        print("Intente nuevamente, algo salio mal.")
-                                                        continue
-
-                                        if MODO_API:
-                                                buscar_auto_api(busqueda)
-                                        else:
-                                                buscar_auto(autos, busqueda)
-                                case 2:
-                                        limpiar_consola()
-                                        while True:
-                                                try:
-                                                        tipo_combustible = input(
-                                                                "Ingrese el tipo de combustible: "
-                                                        ).strip()
-                                                        if not tipo_combustible:
-                                                                print("El tipo de combustible no puede estar vacío.")
-                                                                continue
-                                                        break
-                                                except Exception:
-                                                        print("Intente nuevamente, algo salio mal")
-                                                        continue
-                                        if MODO_API:
-                                                filtrar_combustible_api(tipo_combustible)
-                                        else:
-                                                filtrar_combustible(autos, tipo_combustible)
-                                case 3:
-                                        limpiar_consola()
-                                        if MODO_API:
-                                                filtrar_año_api()
-                                        else:
-                                                filtrar_año(autos)
-                                case 4:
-                                        limpiar_consola()
-                                        while True:
-                                                try:
-                                                        transmision = input(
-                                                                "Ingrese el tipo de transmisión (Manual/Automática): "
-                                                        ).strip()
-                                                        if not transmision:
-                                                                print("La transmisión no puede estar vacía.")
-                                                                continue
-                                                        break
-                                                except Exception:
-                                                        print("Intente nuevamente, algo salio mal")
-                                                        continue
-                                        if MODO_API:
-                                                filtrar_transmision_api(transmision)
-                                        else:
-                                                filtrar_transmision(autos, transmision)
-                                case 5:
-                                        limpiar_consola()
-                                        while True:
-                                                campo = input(
-                                                        "Campo para ordenar (marca/modelo/año/tipocombustible/transmision): "
-                                                ).strip().lower()
-                                                if campo:
-                                                        break
-                                                print("Campo inválido.")
-
-                                        while True:
-                                                desc_input = input(
-                                                        "¿Querés orden descendente? (s/n): "
-                                                ).strip().lower()
-                                                if desc_input in {"s", "n"}:
-                                                        break
-                                                print("Responda con 's' para sí o 'n' para no.")
-                                        descendente = desc_input == "s"
-                                        if MODO_API:
-                                                ordenar_autos_api(campo, descendente)
-                                        else:
-                                                ordenar_autos(autos, campo, descendente)
-                                case 6:
-                                        limpiar_consola()
-                                        if MODO_API:
-                                                estadisticas_api()
-                                        else:
-                                                mostrar_estadisticas(autos)
-                                case 7:
-                                        limpiar_consola()
-                                        if MODO_API:
-                                                agregar_auto_api()
-                                        else:
-                                                agregar_auto(autos)
-                                                escribir_csv(db_path, autos)
-                                case 8:
-                                        limpiar_consola()
-                                        if MODO_API:
-                                                editar_auto_api()
-                                        else:
-                                                editar_auto(autos)
-                                                escribir_csv(db_path, autos)
-                                case 9:
-                                        limpiar_consola()
-                                        if MODO_API:
-                                                borrar_auto_api()
-                                        else:
-                                                if borrar_auto(autos):
-                                                        escribir_csv(db_path, autos)
-                                case 10:
-                                        limpiar_consola()
-                                        elegir_modo()
-                                case 11:
-                                        limpiar_consola()
-                                        salida()
-                                        break
-                                case _:
-                                        limpiar_consola()
-                                        error_tipeo_menu(opcion)
+                        limpiar_consola()
+                        if opcion == OPCION_SALIR:
+                                BACKEND.guardar_pendientes()
+                                salida()
+                                break
+
+                        operacion = OPS.get(opcion)
+                        if operacion is None:
+                                error_tipeo_menu(opcion)
+                        else:
+                                operacion()
                 except ValueError:
                         limpiar_consola()
                         except_men_principal()
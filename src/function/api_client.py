@@ -4,34 +4,196 @@ Este módulo ofrece funciones básicas para:
 - Verificar si el servidor está en línea.
 - Listar, buscar, crear, actualizar y eliminar autos desde la API.
 
-Las funciones usan solicitudes HTTP (GET/POST/PATCH/DELETE) con `requests`.
+Las funciones usan solicitudes HTTP (GET/POST/PATCH/DELETE) con `requests`
+a través de una única sesión compartida (`_SESSION`), que reutiliza las
+conexiones TCP (keep-alive) entre llamadas en lugar de abrir una nueva cada vez.
+`requests` se importa recién en la primera petición (ver `_sesion`), así el
+modo local no paga su tiempo de carga.
 Se busca un código claro y simple, ideal para primer año.
 """
 
-from typing import Optional, List, Dict
+import atexit
+import functools
+import logging
+from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, List, Dict, Iterator
+
+# Codificación JSON: se usa `orjson` si está instalado (bastante más rápido al
+# crear o actualizar muchos autos); si no, el módulo estándar `json`.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
 
+    def _dumps(obj) -> bytes:
+        """Convierte `obj` a JSON codificado en UTF-8."""
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
+
+# Lectura incremental de listados grandes: opcional, ver `iter_autos`.
 try:
-    import requests
+    import ijson
 except ImportError:
-    raise SystemExit(
-        "*********************😎****************************\n"
-        "*          Falta el paquete 'requests'.           *\n"
-        "* Tener presente la version de python que tienes  *\n"
-        "* Por ejemplo tengo pythob 3.13:                  *\n"
-        "*   Windows: py -3.13 -m pip install requests     *\n"
-        "*   Linux/Mac: python3 -m pip install requests    *\n"
-        "* Es fundamental para que el proyecto funcione    *\n"
-        "* Se utiliza para comunicarse con el servidor API *\n"
-        "*********************👌***************************"
-    )
+    ijson = None
+
+from function.columnas import indice_por_modelo, invalidar as invalidar_columnas
+from function.tools import normalizar
+
+_log = logging.getLogger(__name__)
 
 # URL base del servidor de la API (sin barra final).
 BASE_URL = "http://149.50.150.15:8010".rstrip("/")
 
+# Módulo `requests` y sesión HTTP compartida; se crean en la primera petición
+# (ver `_sesion`).
+requests = None
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# Cantidad máxima de peticiones simultáneas en las operaciones masivas; coincide
+# con el tamaño del pool de conexiones de la sesión.
+MAX_PETICIONES_PARALELAS = 16
+
+# Cabeceras de los cuerpos JSON ya serializados que se envían con `data=`.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _sesion():
+    """Devuelve la sesión HTTP compartida, creándola en el primer uso.
 
+    La sesión mantiene un pool de conexiones abiertas y reintenta
+    automáticamente ante errores transitorios del servidor (502/503/504).
+
+    Returns:
+        requests.Session: Sesión compartida por todas las peticiones.
+
+    Raises:
+        SystemExit: Si el paquete `requests` no está instalado.
+    """
+    global requests, _SESSION
+    if _SESSION is not None:
+        return _SESSION
+
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            try:
+                import requests as _requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+            except ImportError:
+                raise SystemExit(
+                    "*********************😎****************************\n"
+                    "*          Falta el paquete 'requests'.           *\n"
+                    "* Tener presente la version de python que tienes  *\n"
+                    "* Por ejemplo tengo pythob 3.13:                  *\n"
+                    "*   Windows: py -3.13 -m pip install requests     *\n"
+                    "*   Linux/Mac: python3 -m pip install requests    *\n"
+                    "* Es fundamental para que el proyecto funcione    *\n"
+                    "* Se utiliza para comunicarse con el servidor API *\n"
+                    "*********************👌***************************"
+                )
+
+            adaptador = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+            )
+            sesion = _requests.Session()
+            sesion.mount("http://", adaptador)
+            sesion.mount("https://", adaptador)
+            requests = _requests
+            _SESSION = sesion
+    return _SESSION
+
+
+def close() -> None:
+    """Cierra la sesión HTTP compartida (si se llegó a crear) y libera sus conexiones.
+
+    Se registra con `atexit` para ejecutarse al terminar el programa.
+    """
+    if _SESSION is not None:
+        _SESSION.close()
+
+
+atexit.register(close)
+
+# Cache en memoria de respuestas GET. Evita repetir la misma consulta HTTP
+# cuando el usuario vuelve a elegir opciones del menú sin cambios en los datos.
+# Cada entrada guarda (momento_de_lectura, respuesta) según `time.monotonic()`.
+# `_CACHE` guarda como máximo `MAX_LISTADOS_EN_CACHE` consultas y descarta la
+# usada hace más tiempo (los dict conservan el orden de inserción).
+# El estado compartido de este módulo (caches, catálogo, cola de ediciones y
+# `_generacion`) también se usa desde los hilos de precarga y de
+# sincronización: toda modificación compuesta se hace con `_ESTADO_LOCK`.
+# Nunca se lo mantiene durante una petición HTTP.
+_ESTADO_LOCK = threading.RLock()
+
+TTL_LISTADO = 30.0
+TTL_ESTADO = 5.0
+MAX_LISTADOS_EN_CACHE = 128
+_CACHE: Dict[tuple, tuple] = {}
+# Último ETag recibido por consulta de listado: (etag, respuesta). Sobrevive a
+# `limpiar_cache`, porque es el servidor quien confirma si sigue vigente.
+_ETAGS: Dict[tuple, tuple] = {}
+_CACHE_ESTADO: Dict[str, tuple] = {}  # clave: BASE_URL consultada
+TTL_AUTO = 15.0
+MAX_AUTOS_EN_CACHE = 512
+_CACHE_AUTO: Dict[int, tuple] = {}  # clave: id del auto
+_CACHE_MODELO: Dict[str, tuple] = {}  # clave: modelo buscado en minúsculas
+
+# Catálogo completo descargado una sola vez; las búsquedas, filtros, orden y
+# estadísticas del modo API trabajan sobre esta lista en memoria.
+_autos_cache: Optional[List[Dict]] = None
+
+# Descarga del catálogo en segundo plano (ver `precargar_autos`) y contador que
+# se incrementa en cada `limpiar_cache`: una respuesta que llega después de
+# una limpieza ya no se guarda.
+_EJECUTOR_PRECARGA = ThreadPoolExecutor(max_workers=1)
+_precarga: Optional[Future] = None
+_generacion = 0
+
+# Ediciones aún no enviadas al servidor (id -> cambios), ver `encolar_cambio`.
+LIMITE_CAMBIOS_PENDIENTES = 32
+_CAMBIOS_PENDIENTES: Dict[int, Dict] = {}
+
+# Si el servidor acepta `/autos/bulk` (None: todavía no se probó). Un servidor
+# sin ese endpoint responde 404/405. Un 422 no cuenta: puede ser un endpoint
+# bulk real que rechaza datos inválidos, y reenviarlos de a uno no serviría.
+_SIN_BULK = (404, 405)
+# Clave: método HTTP (POST para altas, PATCH para ediciones).
+_BULK_DISPONIBLE: Dict[str, Optional[bool]] = {"POST": None, "PATCH": None}
+
+
+def limpiar_cache() -> None:
+    """Descarta todas las respuestas guardadas en el cache de listados.
+
+    Se llama después de crear, actualizar o eliminar autos, y al cambiar la
+    URL base, para que la próxima consulta vuelva a pedir los datos al servidor.
+    También descarta el catálogo completo cargado con `cargar_autos_api` y los
+    autos guardados por `obtener_auto`.
+    """
+    global _autos_cache, _generacion
+    with _ESTADO_LOCK:
+        _generacion += 1
+        _CACHE.clear()
+        _CACHE_AUTO.clear()
+        _CACHE_MODELO.clear()
+        _autos_cache = None
+
+
+@functools.lru_cache(maxsize=None)
 def _url(ruta: str) -> str:
     """Arma una URL completa a partir de la ruta.
 
+    El resultado se memoriza por ruta; `establecer_base_url` limpia esa memoria.
+
     Args:
         ruta (str): Ruta que comienza con '/' (por ejemplo, '/autos').
 
@@ -41,28 +203,135 @@ def _url(ruta: str) -> str:
     return f"{BASE_URL}{ruta}"
 
 
+# URLs fijas de los endpoints, armadas una sola vez para la `BASE_URL` vigente.
+_URL_HEALTH = _url("/health")
+_URL_AUTOS = _url("/autos")
+_URL_AUTOS_BULK = _url("/autos/bulk")
+
+
+def _url_auto_id(id_auto: int) -> str:
+    """Devuelve la URL de un auto puntual (`/autos/{id}`)."""
+    return f"{_URL_AUTOS}/{id_auto}"
+
+
+def establecer_ttl_listado(segundos: float) -> None:
+    """Cambia cuántos segundos se reutilizan los listados guardados en cache.
+
+    Args:
+        segundos (float): Nuevo TTL; 0 desactiva el cache de listados.
+    """
+    global TTL_LISTADO
+    TTL_LISTADO = max(0.0, float(segundos))
+    limpiar_cache()
+
+
 def establecer_base_url(url: str) -> None:
     """Cambia la URL base del servidor API.
 
     Args:
         url (str): Nueva URL base. Se ignora la barra final si existe.
     """
-    global BASE_URL
+    global BASE_URL, _URL_HEALTH, _URL_AUTOS, _URL_AUTOS_BULK, _BULK_DISPONIBLE
     BASE_URL = (url or "").rstrip("/")
+    _url.cache_clear()
+    with _ESTADO_LOCK:
+        _ETAGS.clear()
+    _URL_HEALTH = _url("/health")
+    _URL_AUTOS = _url("/autos")
+    _URL_AUTOS_BULK = _url("/autos/bulk")
+    _BULK_DISPONIBLE = {"POST": None, "PATCH": None}
+    limpiar_cache()
+
+
+def _get(
+    url: str,
+    params: Optional[Dict[str, str]] = None,
+    timeout: float = 10,
+    cabeceras: Optional[Dict[str, str]] = None,
+):
+    """Envía un GET con la sesión compartida.
+
+    Args:
+        url (str): URL completa del endpoint.
+        params (dict | None): Parámetros de la query string.
+        timeout (float): Segundos máximos de espera.
+        cabeceras (dict | None): Cabeceras extra solo para este envío.
+
+    Returns:
+        requests.Response: Respuesta del servidor.
+    """
+    return _sesion().get(url, params=params, headers=cabeceras, timeout=timeout)
 
 
 def estado_servidor() -> Dict:
     """Consulta el estado del servidor (endpoint de salud).
 
+    El resultado se reutiliza durante `TTL_ESTADO` segundos para no volver a
+    consultar `/health` en cada cambio de modo.
+
     Returns:
         dict: Respuesta JSON con información de estado.
 
     Raises:
         requests.HTTPError: Si la respuesta no es correcta (4xx/5xx).
     """
-    resp = requests.get(_url("/health"), timeout=5)
+    guardado = _CACHE_ESTADO.get(BASE_URL)
+    if guardado is not None and time.monotonic() - guardado[0] < TTL_ESTADO:
+        return guardado[1]
+
+    resp = _get(_URL_HEALTH, timeout=5)
     resp.raise_for_status()
-    return resp.json()
+    estado = _loads(resp.content)
+    _CACHE_ESTADO[BASE_URL] = (time.monotonic(), estado)
+    return estado
+
+
+def ping() -> bool:
+    """Indica si el servidor responde correctamente en `/health`.
+
+    A diferencia de `estado_servidor`, no lanza excepciones: un error de
+    conexión, una respuesta 4xx/5xx o un cuerpo que no es JSON (por ejemplo,
+    la página HTML de un proxy) devuelven False. Una respuesta correcta
+    reciente (`TTL_ESTADO`) se reutiliza sin volver a consultar.
+
+    Returns:
+        bool: True si el servidor está en línea.
+    """
+    guardado = _CACHE_ESTADO.get(BASE_URL)
+    if guardado is not None and time.monotonic() - guardado[0] < TTL_ESTADO:
+        return True
+
+    _sesion()
+    try:
+        resp = _get(_URL_HEALTH, timeout=2)
+    except requests.RequestException:
+        return False
+    if not resp.ok:
+        return False
+    try:
+        estado = _loads(resp.content)
+    except ValueError:
+        return False
+    _CACHE_ESTADO[BASE_URL] = (time.monotonic(), estado)
+    return True
+
+
+def _parametros_listado(
+    q: Optional[str],
+    tipo_combustible: Optional[str],
+    ordenar_por: Optional[str],
+    descendente: bool,
+    transmision: Optional[str] = None,
+) -> Dict[str, str]:
+    """Arma los parámetros de `GET /autos`, omitiendo los que no se usan."""
+    valores = {
+        "q": q,
+        "TipoCombustible": tipo_combustible,
+        "Transmisión": transmision,
+        "sort_by": ordenar_por,
+        "desc": "true" if descendente else None,
+    }
+    return {k: v for k, v in valores.items() if v}
 
 
 def listar_autos(
@@ -70,14 +339,22 @@ def listar_autos(
     tipo_combustible: Optional[str] = None,
     ordenar_por: Optional[str] = None,
     descendente: bool = False,
+    transmision: Optional[str] = None,
 ) -> List[Dict]:
     """Lista autos con filtros y orden opcional.
 
+    Las respuestas se guardan en un cache en memoria por combinación de
+    parámetros durante `TTL_LISTADO` segundos (ver `establecer_ttl_listado`),
+    hasta `MAX_LISTADOS_EN_CACHE` combinaciones. La lista devuelta es
+    compartida con el cache, por lo que no debe modificarse.
+
     Args:
         q (str | None): Texto para buscar por marca o modelo.
         tipo_combustible (str | None): Filtro por tipo de combustible.
         ordenar_por (str | None): Campo de orden (ej.: 'Marca', 'Modelo', 'Año').
         descendente (bool): Si True, orden descendente.
+        transmision (str | None): Filtro por transmisión. Un servidor que no
+            lo soporte lo ignora, por lo que conviene volver a verificarlo.
 
     Returns:
         list[dict]: Lista de autos con estructura: Marca, Modelo, Año, TipoCombustible, Transmisión.
@@ -85,24 +362,153 @@ def listar_autos(
     Raises:
         requests.HTTPError: Si la respuesta no es correcta.
     """
-    params: Dict[str, str] = {}
-    if q:
-        params["q"] = q
-    if tipo_combustible:
-        params["TipoCombustible"] = tipo_combustible
-    if ordenar_por:
-        params["sort_by"] = ordenar_por
-    if descendente:
-        params["desc"] = "true"
-
-    resp = requests.get(_url("/autos"), params=params, timeout=10)
-    resp.raise_for_status()
-    return resp.json()
+    clave = (q, tipo_combustible, ordenar_por, descendente, transmision)
+    with _ESTADO_LOCK:
+        guardado = _CACHE.pop(clave, None)
+        if guardado is not None and time.monotonic() - guardado[0] < TTL_LISTADO:
+            _CACHE[clave] = guardado  # vuelve al final: usada recientemente
+            return guardado[1]
+
+    # El servidor tiene que conocer las ediciones encoladas antes de responder.
+    _vaciar_antes_de_leer()
+
+    with _ESTADO_LOCK:
+        generacion = _generacion
+        # Si el servidor mandó un ETag la última vez, se pregunta si hubo
+        # cambios; con 304 se reutiliza la lista anterior sin volver a descargarla.
+        validador = _ETAGS.get(clave)
+    params = _parametros_listado(q, tipo_combustible, ordenar_por, descendente, transmision)
+    cabeceras = {"If-None-Match": validador[0]} if validador else None
+    resp = _get(_URL_AUTOS, params=params, cabeceras=cabeceras)
+    if resp.status_code == 304 and validador:
+        autos = validador[1]
+        etag = None
+    else:
+        resp.raise_for_status()
+        autos = _loads(resp.content)
+        etag = resp.headers.get("ETag")
+    with _ESTADO_LOCK:
+        if generacion != _generacion:
+            # Hubo una edición o una limpieza mientras tanto: no se guarda nada
+            return autos
+        if etag:
+            if len(_ETAGS) >= MAX_LISTADOS_EN_CACHE:
+                del _ETAGS[next(iter(_ETAGS))]
+            _ETAGS[clave] = (etag, autos)
+        if len(_CACHE) >= MAX_LISTADOS_EN_CACHE:
+            del _CACHE[next(iter(_CACHE))]
+        _CACHE[clave] = (time.monotonic(), autos)
+    return autos
+
+
+def iter_autos(
+    q: Optional[str] = None,
+    tipo_combustible: Optional[str] = None,
+    ordenar_por: Optional[str] = None,
+    descendente: bool = False,
+) -> Iterator[Dict]:
+    """Recorre los autos de `GET /autos` a medida que llegan del servidor.
+
+    Con el paquete opcional `ijson` instalado, cada auto se decodifica en
+    cuanto se recibe, sin armar la lista completa en memoria; quien consume
+    puede dejar de iterar apenas encuentra lo que busca y la respuesta se
+    cierra sin descargar el resto. Sin `ijson` se decodifica la respuesta
+    completa y se recorre igual. No usa el cache de `listar_autos`.
+
+    Args:
+        q (str | None): Texto para buscar por marca o modelo.
+        tipo_combustible (str | None): Filtro por tipo de combustible.
+        ordenar_por (str | None): Campo de orden (ej.: 'Marca', 'Modelo', 'Año').
+        descendente (bool): Si True, orden descendente.
+
+    Yields:
+        dict: Cada auto de la respuesta.
+
+    Raises:
+        requests.HTTPError: Si la respuesta no es correcta.
+    """
+    _vaciar_antes_de_leer()
+    params = _parametros_listado(q, tipo_combustible, ordenar_por, descendente)
+    with _sesion().get(_URL_AUTOS, params=params, stream=True, timeout=10) as resp:
+        resp.raise_for_status()
+        if ijson is None:
+            yield from _loads(resp.content)
+        else:
+            resp.raw.decode_content = True
+            yield from ijson.items(resp.raw, "item", use_float=True)
+
+
+def cargar_autos_api() -> List[Dict]:
+    """Devuelve el catálogo completo de autos, descargándolo solo la primera vez.
+
+    La lista queda guardada hasta que una alta, edición o baja (o un cambio de
+    URL base) la invalide, de modo que varias operaciones seguidas del menú
+    usan un único GET a `/autos`.
+
+    Returns:
+        list[dict]: Lista completa de autos (compartida, no modificar).
+
+    Raises:
+        requests.HTTPError: Si la respuesta no es correcta.
+    """
+    _esperar_precarga()
+    autos = _autos_cache
+    if autos is None:
+        return _descargar_catalogo()
+    return autos
+
+
+def autos_en_memoria() -> Optional[List[Dict]]:
+    """Devuelve el catálogo completo si ya está descargado, sin ir al servidor.
+
+    Si hay una precarga en curso, espera a que termine.
+
+    Returns:
+        list[dict] | None: Catálogo en memoria (compartido, no modificar) o None.
+    """
+    _esperar_precarga()
+    return _autos_cache
+
+
+def _descargar_catalogo() -> List[Dict]:
+    """Descarga el catálogo completo y lo guarda si no hubo cambios mientras tanto."""
+    global _autos_cache
+    generacion = _generacion
+    autos = listar_autos()
+    with _ESTADO_LOCK:
+        if generacion == _generacion:
+            _autos_cache = autos
+    return autos
+
+
+def precargar_autos() -> None:
+    """Empieza a descargar el catálogo completo en segundo plano.
+
+    Se llama al entrar al modo API: mientras el usuario elige una opción del
+    menú, el catálogo ya viaja por la red y `cargar_autos_api` lo encuentra
+    listo (o espera solo lo que falte). Los errores se ignoran acá; la próxima
+    consulta los informa normalmente.
+    """
+    global _precarga
+    if _autos_cache is None and (_precarga is None or _precarga.done()):
+        _precarga = _EJECUTOR_PRECARGA.submit(_descargar_catalogo)
+
+
+def _esperar_precarga() -> None:
+    """Espera a que termine la precarga del catálogo, si hay una en curso."""
+    if _precarga is not None and not _precarga.done():
+        try:
+            _precarga.result()
+        except Exception:
+            pass
 
 
 def obtener_auto(id_auto: int) -> Dict:
     """Obtiene un auto por su identificador numérico.
 
+    La respuesta se reutiliza durante `TTL_AUTO` segundos (hasta
+    `MAX_AUTOS_EN_CACHE` autos); editar o borrar el auto la descarta.
+
     Args:
         id_auto (int): Identificador del auto.
 
@@ -112,9 +518,77 @@ def obtener_auto(id_auto: int) -> Dict:
     Raises:
         requests.HTTPError: Si no existe o hay error del servidor.
     """
-    resp = requests.get(_url(f"/autos/{id_auto}"), timeout=10)
+    _vaciar_antes_de_leer()
+    guardado = _CACHE_AUTO.get(id_auto)
+    if guardado is not None and time.monotonic() - guardado[0] < TTL_AUTO:
+        return guardado[1]
+
+    resp = _sesion().get(_url_auto_id(id_auto), timeout=10)
     resp.raise_for_status()
-    return resp.json()
+    auto = _loads(resp.content)
+    with _ESTADO_LOCK:
+        if len(_CACHE_AUTO) >= MAX_AUTOS_EN_CACHE:
+            _CACHE_AUTO.clear()
+        _CACHE_AUTO[id_auto] = (time.monotonic(), auto)
+    return auto
+
+
+@dataclass(slots=True, frozen=True)
+class AutoPayload:
+    """Datos de un auto nuevo, listos para enviar al servidor.
+
+    Attributes:
+        marca (str): Marca del auto.
+        modelo (str): Modelo del auto.
+        año (int): Año del auto.
+        tipo_combustible (str): Tipo de combustible.
+        transmision (str): Tipo de transmisión.
+    """
+
+    marca: str
+    modelo: str
+    año: int
+    tipo_combustible: str
+    transmision: str
+
+    @classmethod
+    def desde_dict(cls, auto: Dict) -> "AutoPayload":
+        """Arma el payload desde un diccionario con las claves del CSV.
+
+        Raises:
+            KeyError: Si faltan claves requeridas en el diccionario.
+        """
+        return cls(
+            auto["Marca"],
+            auto["Modelo"],
+            int(auto["Año"]),
+            auto["TipoCombustible"],
+            auto["Transmisión"],
+        )
+
+
+def _como_dict(p: AutoPayload) -> Dict:
+    """Devuelve el diccionario con las claves del CSV que espera el servidor."""
+    return {
+        "Marca": p.marca,
+        "Modelo": p.modelo,
+        "Año": p.año,
+        "TipoCombustible": p.tipo_combustible,
+        "Transmisión": p.transmision,
+    }
+
+
+def _serializar(p: AutoPayload) -> bytes:
+    """Convierte un `AutoPayload` al JSON que espera `POST /autos`."""
+    return _dumps(_como_dict(p))
+
+
+def _crear(payload: AutoPayload) -> Dict:
+    """Envía el alta de `payload` al servidor y limpia el cache de listados."""
+    resp = _sesion().post(_URL_AUTOS, data=_serializar(payload), headers=_JSON_HEADERS, timeout=10)
+    resp.raise_for_status()
+    limpiar_cache()
+    return _loads(resp.content)
 
 
 def crear_auto(
@@ -139,16 +613,16 @@ def crear_auto(
     Raises:
         requests.HTTPError: Si la creación falla.
     """
-    payload = {
-        "Marca": marca,
-        "Modelo": modelo,
-        "Año": int(año),
-        "TipoCombustible": tipo_combustible,
-        "Transmisión": transmision,
-    }
-    resp = requests.post(_url("/autos"), json=payload, timeout=10)
+    return _crear(AutoPayload(marca, modelo, int(año), tipo_combustible, transmision))
+
+
+def _patch(id_auto: int, cambios: Dict) -> Dict:
+    """Envía un PATCH de un auto sin tocar los caches."""
+    resp = _sesion().patch(
+        _url_auto_id(id_auto), data=_dumps(cambios), headers=_JSON_HEADERS, timeout=10
+    )
     resp.raise_for_status()
-    return resp.json()
+    return _loads(resp.content)
 
 
 def actualizar_auto_parcial(id_auto: int, cambios: Dict) -> Dict:
@@ -164,9 +638,11 @@ def actualizar_auto_parcial(id_auto: int, cambios: Dict) -> Dict:
     Raises:
         requests.HTTPError: Si la actualización falla.
     """
-    resp = requests.patch(_url(f"/autos/{id_auto}"), json=cambios, timeout=10)
-    resp.raise_for_status()
-    return resp.json()
+    actualizado = _patch(id_auto, cambios)
+    with _ESTADO_LOCK:
+        _CAMBIOS_PENDIENTES.pop(id_auto, None)
+    limpiar_cache()
+    return actualizado
 
 
 def eliminar_auto(id_auto: int) -> bool:
@@ -181,9 +657,12 @@ def eliminar_auto(id_auto: int) -> bool:
     Raises:
         requests.HTTPError: Si el servidor devuelve un error.
     """
-    resp = requests.delete(_url(f"/autos/{id_auto}"), timeout=10)
+    resp = _sesion().delete(_url_auto_id(id_auto), timeout=10)
     if resp.status_code not in (200, 204):
         resp.raise_for_status()
+    with _ESTADO_LOCK:
+        _CAMBIOS_PENDIENTES.pop(id_auto, None)
+    limpiar_cache()
     return True
 
 
@@ -206,7 +685,12 @@ def listar_todos(
 def buscar_por_modelo(modelo: str) -> Optional[Dict]:
     """Busca un auto por modelo (intenta coincidencia exacta primero).
 
-    Si no encuentra coincidencia exacta, devuelve el primer resultado de la lista.
+    Si el catálogo completo ya está cargado (`cargar_autos_api`), la
+    coincidencia exacta se resuelve con su índice por modelo sin ir al
+    servidor. Si no, recorre la respuesta de la API con `iter_autos` y se
+    detiene en la primera coincidencia exacta; si no hay ninguna devuelve el
+    primer resultado. Lo encontrado por la API se reutiliza durante
+    `TTL_LISTADO` segundos para el mismo modelo.
 
     Args:
         modelo (str): Modelo a buscar.
@@ -217,12 +701,26 @@ def buscar_por_modelo(modelo: str) -> Optional[Dict]:
     if not modelo:
         return None
 
-    candidatos = listar_autos(q=modelo, ordenar_por="Modelo")
-    n = (modelo or "").strip().lower()
-    for c in candidatos:
+    catalogo = _autos_cache
+    if catalogo is not None:
+        posiciones = indice_por_modelo(catalogo).get(normalizar(modelo))
+        if posiciones:
+            return catalogo[posiciones[0]]
+
+    n = modelo.strip().lower()
+    guardado = _CACHE_MODELO.get(n)
+    if guardado is not None and time.monotonic() - guardado[0] < TTL_LISTADO:
+        return guardado[1]
+
+    encontrado = None
+    for c in iter_autos(q=n, ordenar_por="Modelo"):
         if c.get("Modelo", "").strip().lower() == n:
-            return c
-    return candidatos[0] if candidatos else None
+            encontrado = c
+            break
+        if encontrado is None:
+            encontrado = c
+    _CACHE_MODELO[n] = (time.monotonic(), encontrado)
+    return encontrado
 
 
 def crear_desde_dict(auto: Dict) -> Dict:
@@ -238,10 +736,245 @@ def crear_desde_dict(auto: Dict) -> Dict:
         KeyError: Si faltan claves requeridas en el diccionario.
         requests.HTTPError: Si la creación falla.
     """
-    return crear_auto(
-        marca=auto["Marca"],
-        modelo=auto["Modelo"],
-        año=int(auto["Año"]),
-        tipo_combustible=auto["TipoCombustible"],
-        transmision=auto["Transmisión"],
-    )
+    return _crear(AutoPayload.desde_dict(auto))
+
+
+def crear_muchos(autos: List[Dict]) -> List[Dict]:
+    """Crea varios autos en paralelo (por ejemplo, al subir todo el CSV).
+
+    Cada alta es un POST independiente; se envían en simultáneo sobre las
+    conexiones de la sesión compartida.
+
+    Args:
+        autos (list[dict]): Autos con las claves del CSV.
+
+    Returns:
+        list[dict]: Autos creados, en el mismo orden que `autos`.
+
+    Raises:
+        KeyError: Si a algún auto le faltan claves requeridas.
+        requests.HTTPError: Si alguna creación falla.
+    """
+    if not autos:
+        return []
+    with ThreadPoolExecutor(max_workers=min(MAX_PETICIONES_PARALELAS, len(autos))) as ejecutor:
+        return list(ejecutor.map(crear_desde_dict, autos))
+
+
+def crear_autos_bulk(autos: List[Dict]) -> List[Dict]:
+    """Crea varios autos con la menor cantidad de peticiones.
+
+    Intenta un único `POST /autos/bulk` con la lista de autos. Si el servidor
+    no tiene ese endpoint (404/405), lo recuerda y usa `crear_muchos`.
+
+    Args:
+        autos (list[dict]): Autos con las claves del CSV.
+
+    Returns:
+        list[dict]: Autos creados (respuesta del servidor).
+
+    Raises:
+        KeyError: Si a algún auto le faltan claves requeridas.
+        requests.HTTPError: Si la creación falla.
+    """
+    if not autos:
+        return []
+
+    if _BULK_DISPONIBLE["POST"] is not False:
+        cuerpo = [_como_dict(AutoPayload.desde_dict(a)) for a in autos]
+        resp = _sesion().post(
+            _URL_AUTOS_BULK, data=_dumps(cuerpo), headers=_JSON_HEADERS, timeout=30
+        )
+        if resp.status_code not in _SIN_BULK:
+            resp.raise_for_status()
+            _BULK_DISPONIBLE["POST"] = True
+            limpiar_cache()
+            return _loads(resp.content)
+        _BULK_DISPONIBLE["POST"] = False
+
+    return crear_muchos(autos)
+
+
+def actualizar_muchos(items: List[tuple], paralelo: bool = True) -> List[Dict]:
+    """Actualiza parcialmente varios autos con la menor cantidad de peticiones.
+
+    Primero intenta un único `PATCH /autos/bulk` con el cuerpo
+    `[{"id": ..., "cambios": {...}}, ...]`. Si el servidor no tiene ese
+    endpoint (404/405), lo recuerda y envía los PATCH individuales en paralelo.
+    El cache de listados se limpia una sola vez al final.
+
+    Args:
+        items (list[tuple[int, dict]]): Pares (id del auto, cambios).
+        paralelo (bool): Si False, los PATCH individuales se envían de a uno
+            (necesario al terminar el programa, cuando ya no se pueden crear hilos).
+
+    Returns:
+        list[dict]: Autos actualizados (respuesta del servidor).
+
+    Raises:
+        requests.HTTPError: Si alguna actualización falla.
+    """
+    if not items:
+        return []
+
+    try:
+        if _BULK_DISPONIBLE["PATCH"] is not False:
+            cuerpo = [{"id": id_auto, "cambios": cambios} for id_auto, cambios in items]
+            resp = _sesion().patch(
+                _URL_AUTOS_BULK, data=_dumps(cuerpo), headers=_JSON_HEADERS, timeout=30
+            )
+            if resp.status_code not in _SIN_BULK:
+                resp.raise_for_status()
+                _BULK_DISPONIBLE["PATCH"] = True
+                return _loads(resp.content)
+            _BULK_DISPONIBLE["PATCH"] = False
+
+        if not paralelo:
+            return [_patch(id_auto, cambios) for id_auto, cambios in items]
+        with ThreadPoolExecutor(max_workers=min(MAX_PETICIONES_PARALELAS, len(items))) as ejecutor:
+            return list(ejecutor.map(lambda item: _patch(*item), items))
+    finally:
+        limpiar_cache()
+
+
+def encolar_cambio(id_auto: int, cambios: Dict) -> None:
+    """Guarda una edición para enviarla más tarde junto con otras.
+
+    Los cambios del mismo auto se combinan. Se aplican en el momento sobre el
+    catálogo en memoria (`cargar_autos_api`) para que el menú ya los muestre,
+    y se envían al servidor con `vaciar_cambios()` al juntar
+    `LIMITE_CAMBIOS_PENDIENTES` autos, antes de cualquier consulta al servidor
+    y al cambiar de modo o salir.
+
+    Args:
+        id_auto (int): Identificador del auto a modificar.
+        cambios (dict): Campos a actualizar.
+
+    Raises:
+        requests.HTTPError: Si al alcanzar el límite el envío falla.
+    """
+    global _generacion
+    with _ESTADO_LOCK:
+        _CAMBIOS_PENDIENTES.setdefault(id_auto, {}).update(cambios)
+
+        # Los listados filtrados en cache ya no reflejan el cambio; el catálogo
+        # completo se corrige en el lugar.
+        _generacion += 1
+        _CACHE.clear()
+        _CACHE_MODELO.clear()
+        if _autos_cache is not None:
+            for auto in _autos_cache:
+                if auto.get("id") == id_auto:
+                    auto.update(cambios)
+            # La tabla columnar del catálogo (búsqueda, filtros, orden y
+            # estadísticas) se arma por identidad de lista: hay que avisarle.
+            invalidar_columnas()
+        lleno = len(_CAMBIOS_PENDIENTES) >= LIMITE_CAMBIOS_PENDIENTES
+
+    if lleno:
+        vaciar_cambios()
+
+
+def vaciar_cambios(paralelo: bool = True) -> List[Dict]:
+    """Envía al servidor todas las ediciones encoladas con `encolar_cambio`.
+
+    Si el servidor rechaza el envío (4xx), los cambios se reenvían de a uno
+    para saber cuál falla: los rechazados se descartan y se informan por
+    consola, porque reenviarlos volvería a fallar. Ante errores de red o del
+    servidor (5xx) los cambios vuelven a la cola (sin pisar ediciones más
+    nuevas del mismo auto) y se relanza el error.
+
+    En ambos casos se descarta el catálogo en memoria, que ya tenía los
+    cambios aplicados: el menú vuelve a mostrar lo que realmente tiene el servidor.
+
+    Args:
+        paralelo (bool): Ver `actualizar_muchos`.
+
+    Returns:
+        list[dict]: Autos actualizados (lista vacía si no había cambios).
+
+    Raises:
+        requests.RequestException: Si el envío falla por la red o el servidor.
+    """
+    with _ESTADO_LOCK:
+        if not _CAMBIOS_PENDIENTES:
+            return []
+        items = list(_CAMBIOS_PENDIENTES.items())
+        _CAMBIOS_PENDIENTES.clear()
+    try:
+        return actualizar_muchos(items, paralelo)
+    except Exception as e:
+        if not _es_rechazo(e):
+            _reencolar(items)
+            raise
+
+    actualizados = []
+    error_transitorio = None
+    for id_auto, cambios in items:
+        try:
+            actualizados.append(_patch(id_auto, cambios))
+        except Exception as e:
+            if not _es_rechazo(e):
+                _reencolar([(id_auto, cambios)])
+                error_transitorio = error_transitorio or e
+                continue
+            print(f"⚠️ El servidor rechazó el cambio del auto id={id_auto} {cambios}: {e}. Se descartó.")
+    _descartar_catalogo()
+    if error_transitorio is not None:
+        raise error_transitorio
+    return actualizados
+
+
+def _es_rechazo(error: Exception) -> bool:
+    """Indica si `error` es una respuesta 4xx: el servidor no acepta el pedido."""
+    resp = getattr(error, "response", None)
+    return resp is not None and 400 <= resp.status_code < 500
+
+
+def _reencolar(items: List[tuple]) -> None:
+    """Devuelve a la cola cambios que no se pudieron enviar (ver `vaciar_cambios`)."""
+    with _ESTADO_LOCK:
+        for id_auto, cambios in items:
+            _CAMBIOS_PENDIENTES[id_auto] = {**cambios, **_CAMBIOS_PENDIENTES.get(id_auto, {})}
+    _descartar_catalogo()
+
+
+def _descartar_catalogo() -> None:
+    """Descarta el catálogo y los listados guardados con ediciones locales.
+
+    Un 304 devolvería la lista guardada con el ETag, que es la misma que
+    `encolar_cambio` corrigió en el lugar: también se descartan los ETags.
+    """
+    with _ESTADO_LOCK:
+        _ETAGS.clear()
+        limpiar_cache()
+
+
+def _vaciar_antes_de_leer() -> None:
+    """Envía las ediciones encoladas antes de una consulta, sin hacerla fallar.
+
+    Si el envío falla, los cambios quedan en la cola para el próximo intento y
+    la consulta sigue normalmente.
+    """
+    try:
+        vaciar_cambios()
+    except Exception:
+        _log.warning("No se pudieron enviar los cambios pendientes al servidor", exc_info=True)
+
+
+def hay_cambios_pendientes() -> bool:
+    """Indica si quedan ediciones encoladas sin enviar al servidor."""
+    with _ESTADO_LOCK:
+        return bool(_CAMBIOS_PENDIENTES)
+
+
+def _vaciar_cambios_al_salir() -> None:
+    """Envía las ediciones pendientes al terminar el programa."""
+    try:
+        vaciar_cambios(paralelo=False)
+    except Exception as e:
+        print(f"⚠️ No se pudieron enviar los cambios pendientes al servidor: {e}")
+
+
+# Se registra después de `close`, por lo que se ejecuta antes de cerrar la sesión.
+atexit.register(_vaciar_cambios_al_salir)
@@ -2,49 +2,170 @@
 
 Este módulo proporciona funciones para interactuar con la API de autos
 usando directamente los campos del CSV: Marca, Modelo, Año, TipoCombustible, Transmisión.
+
+Las búsquedas, filtros, ordenamientos y estadísticas descargan el catálogo una
+sola vez (`api_client.cargar_autos_api`) y lo procesan en memoria con las
+mismas funciones del modo local.
 """
 
-import os
+import atexit
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from itertools import chain
 from pathlib import Path
-from function.tools import normalizar, escribir_csv
-from function.view import mostrar_autos, ordenar_autos
+from function.tools import normalizar, escribir_csv, append_csv, leer
+from function.view import mostrar_autos_iterable, ordenar_autos
 from function.statistics import mostrar_estadisticas
-from function.shearch import buscar_auto, filtrar_combustible, filtrar_año, filtrar_transmision
+from function.shearch import buscar_auto, filtrar_combustible, filtrar_año
 from function import api_client
 
+_log = logging.getLogger(__name__)
+
+# Ruta del CSV local que se mantiene sincronizado con la API. Se calcula una
+# sola vez (y se asegura su carpeta) para no resolverla en cada sincronización.
+_DB_DIR = Path(__file__).resolve().parent.parent.parent / "src" / "db"
+try:
+    _DB_DIR.mkdir(parents=True, exist_ok=True)
+except OSError:
+    # Sin permisos de escritura: la sincronización fallará en silencio
+    pass
+_DB_PATH = str(_DB_DIR / "autos.csv")
+
+# Las sincronizaciones con el CSV local corren en un hilo aparte, de a una y en
+# orden, para no demorar el menú después de cada alta, edición o baja. Al
+# salir se espera a que terminen las pendientes.
+_SYNC_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+_sync_pendiente = None
+atexit.register(_SYNC_EXECUTOR.shutdown)
+
+# Valores habituales de los campos con opciones fijas. Sirven para avisar de
+# posibles errores de tipeo: la comparación es sin acentos ni mayúsculas y
+# acepta parte del nombre ("hib" -> "Híbrido"). Son solo una sugerencia: el
+# servidor puede tener otros valores (por ejemplo "GNC").
+COMBUSTIBLES = frozenset({"Nafta", "Diesel", "Híbrido", "Eléctrico"})
+TRANSMISIONES = frozenset({"Manual", "Automática"})
+_COMBUSTIBLES_NORM = {normalizar(v): v for v in COMBUSTIBLES}
+_TRANSMISIONES_NORM = {normalizar(v): v for v in TRANSMISIONES}
+
+
+def _es_valor_conocido(texto, conocidos_norm):
+    """Indica si `texto` coincide (completo o en parte) con un valor conocido.
+
+    Args:
+        texto (str): Valor ingresado por el usuario.
+        conocidos_norm (dict[str, str]): Valores normalizados -> originales.
+
+    Returns:
+        bool: True si coincide con alguno.
+    """
+    n = normalizar(texto)
+    return n in conocidos_norm or any(n in k for k in conocidos_norm)
+
+
+def _avisar_si_desconocido(texto, conocidos_norm, campo):
+    """Avisa si `texto` no se parece a ninguno de los valores habituales.
+
+    Es solo un aviso por posibles errores de tipeo: la consulta se hace igual,
+    porque el servidor puede tener valores que no están en la lista.
+    """
+    if not _es_valor_conocido(texto, conocidos_norm):
+        opciones = ", ".join(sorted(conocidos_norm.values()))
+        print(f"\n⚠️ '{texto}' no es un {campo} habitual ({opciones}). Se consulta igual.")
+
+
+# Huella del último catálogo de la API escrito en el CSV local (ver `_huella`).
+_ultima_huella = None
+
+
+def _huella(autos):
+    """Resume el contenido de una lista de autos en un número.
 
-def _sincronizar_api_con_local():
+    Dos listas con los mismos autos en el mismo orden dan la misma huella, así
+    se detecta sin comparar fila por fila si el CSV local ya está al día.
+    """
+    return hash(tuple(
+        (a.get("Marca"), a.get("Modelo"), a.get("Año"), a.get("TipoCombustible"), a.get("Transmisión"))
+        for a in autos
+    ))
+
+
+def olvidar_huella():
+    """Indica que el CSV local se escribió fuera de la sincronización con la API.
+
+    La próxima sincronización vuelve a escribir el catálogo completo en lugar
+    de dar el CSV por actualizado o de solo agregarle las altas.
+    """
+    global _ultima_huella
+    _ultima_huella = None
+
+
+def _sincronizar_api_con_local(altas=None):
     """Sincroniza la estructura jerárquica local con los datos de la API.
     
     Obtiene todos los autos desde la API y los escribe en el archivo CSV local,
     lo que activa automáticamente la sincronización de la estructura jerárquica.
+
+    Si el catálogo no cambió desde la última sincronización no se escribe nada.
+    Si la única diferencia son las `altas` (autos recién creados) al final del
+    catálogo, se agregan esas filas al CSV en lugar de reescribirlo.
+
+    Args:
+        altas (list[dict] | None): Autos recién creados en el servidor, si los hay.
     """
+    global _ultima_huella
     try:
-        # Obtener todos los autos desde la API
-        autos_api = obtener_autos_api()
+        # El CSV refleja solo lo que ya tiene el servidor: con ediciones
+        # encoladas sin enviar, se sincroniza después de `vaciar_cambios`.
+        if api_client.hay_cambios_pendientes():
+            return
+
+        # Obtener todos los autos desde la API (sin mensajes: corre en segundo plano)
+        autos_api = api_client.cargar_autos_api()
         
         if not autos_api:
             # Si no hay datos en la API, no hay nada que sincronizar
             return
+
+        huella = _huella(autos_api)
+        if huella == _ultima_huella:
+            return
         
-        # Obtener la ruta del archivo CSV local
-        # Buscar la ruta del proyecto desde el módulo actual
-        current_file = Path(__file__).resolve()
-        project_root = current_file.parent.parent.parent
-        db_path = project_root / "src" / "db" / "autos.csv"
-        
-        # Si el archivo no existe, crearlo
-        if not db_path.exists():
-            db_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Escribir los datos de la API en el archivo local
-        # Esto activará automáticamente la sincronización jerárquica
-        escribir_csv(str(db_path), autos_api)
+        n = len(altas) if isinstance(altas, list) else 0
+        solo_altas = (
+            0 < n <= len(autos_api)
+            and [a.get("id") for a in autos_api[-n:]] == [a.get("id") for a in altas]
+            and _huella(autos_api[:-n]) == _ultima_huella
+        )
+        if solo_altas:
+            # El CSV local ya tenía todo lo demás: alcanza con agregar las filas nuevas
+            for alta in autos_api[-n:]:
+                append_csv(_DB_PATH, alta)
+        else:
+            # Escribir los datos de la API en el archivo local
+            # Esto activará automáticamente la sincronización jerárquica
+            escribir_csv(_DB_PATH, autos_api)
+        _ultima_huella = huella
         
     except Exception as e:
-        # Si hay error, continuar sin afectar la operación de API
-        # No mostrar error para no confundir al usuario
-        pass
+        # Si hay error, continuar sin afectar la operación de API: queda
+        # registrado, pero la opción del menú que lo disparó ya terminó
+        _log.warning(
+            "No se pudo sincronizar el CSV local con la API: %s", e,
+            exc_info=_log.isEnabledFor(logging.DEBUG),
+        )
+
+
+def _programar_sincronizacion(altas=None):
+    """Encola `_sincronizar_api_con_local(altas)` en el hilo de sincronización."""
+    global _sync_pendiente
+    _sync_pendiente = _SYNC_EXECUTOR.submit(_sincronizar_api_con_local, altas)
+
+
+def esperar_sincronizacion():
+    """Espera a que terminen las sincronizaciones con el CSV local encoladas."""
+    if _sync_pendiente is not None:
+        _sync_pendiente.result()
 
 
 def obtener_autos_api(q=None, tipo_combustible=None, sort_by=None, desc=False):
@@ -56,16 +177,22 @@ def obtener_autos_api(q=None, tipo_combustible=None, sort_by=None, desc=False):
         sort_by (str | None): Campo de ordenamiento (Marca, Modelo, Año, TipoCombustible, Transmisión).
         desc (bool): Si True, orden descendente.
 
+    Sin filtros ni orden se usa el catálogo completo ya descargado
+    (`api_client.cargar_autos_api`).
+
     Returns:
         list[dict]: Lista de autos con estructura: Marca, Modelo, Año, TipoCombustible, Transmisión.
     """
     try:
-        items = api_client.listar_autos(
-            q=q,
-            tipo_combustible=tipo_combustible,
-            ordenar_por=sort_by,
-            descendente=desc,
-        )
+        if q or tipo_combustible or sort_by or desc:
+            items = api_client.listar_autos(
+                q=q,
+                tipo_combustible=tipo_combustible,
+                ordenar_por=sort_by,
+                descendente=desc,
+            )
+        else:
+            items = api_client.cargar_autos_api()
         
         # Verificar que items sea una lista
         if not isinstance(items, list):
@@ -73,144 +200,237 @@ def obtener_autos_api(q=None, tipo_combustible=None, sort_by=None, desc=False):
             return []
         
         # Verificar si la lista está vacía
-        if len(items) == 0:
+        if not items:
             print(f"\n⚠️ No tenemos ese auto en nuestra base de datos.")
             return []
         
         return items
     except Exception as e:
         print(f"⚠️ Error al obtener autos desde la API: {e}")
-        import traceback
-        traceback.print_exc()
+        # El detalle (traceback) solo se arma si el logging está en nivel DEBUG
+        _log.warning("Error de la API: %s", e, exc_info=_log.isEnabledFor(logging.DEBUG))
         return []
 
 
-def buscar_auto_api(busqueda: str):
-    """Busca autos por marca o modelo usando la API.
+def _con_catalogo(funcion):
+    """Decorador: obtiene el catálogo de la API y se lo pasa a `funcion`.
+
+    Si no hay autos (o hubo un error) la función no se ejecuta; el mensaje ya
+    se mostró en `obtener_autos_api`. La función decorada recibe los autos como
+    primer argumento, seguidos de los argumentos originales.
+    """
+    @wraps(funcion)
+    def envoltura(*args, **kwargs):
+        autos = obtener_autos_api()
+        if not autos:
+            return None
+        return funcion(autos, *args, **kwargs)
+    return envoltura
+
+
+@_con_catalogo
+def buscar_auto_api(autos, busqueda: str):
+    """Busca autos por marca o modelo sobre el catálogo obtenido de la API.
 
     Args:
+        autos (list[dict]): Catálogo de la API (lo pasa `_con_catalogo`).
         busqueda (str): Texto a buscar.
     """
-    autos = obtener_autos_api(q=busqueda)
-    if not autos:
-        # El mensaje ya se mostró en obtener_autos_api
-        return
     buscar_auto(autos, busqueda)
 
 
 def filtrar_combustible_api(tipo_combustible: str):
-    """Filtra autos por tipo de combustible usando la API.
+    """Filtra autos por tipo de combustible sobre el catálogo obtenido de la API.
 
     Args:
         tipo_combustible (str): Tipo de combustible a filtrar.
     """
-    autos = obtener_autos_api(tipo_combustible=tipo_combustible)
-    if not autos:
-        # El mensaje ya se mostró en obtener_autos_api
-        return
+    _avisar_si_desconocido(tipo_combustible, _COMBUSTIBLES_NORM, "tipo de combustible")
+    _filtrar_combustible_catalogo(tipo_combustible)
+
+
+@_con_catalogo
+def _filtrar_combustible_catalogo(autos, tipo_combustible):
+    """Filtra por combustible el catálogo de la API (ver `filtrar_combustible_api`)."""
     filtrar_combustible(autos, tipo_combustible)
 
 
-def filtrar_año_api():
+@_con_catalogo
+def filtrar_año_api(autos):
     """Filtra autos por rango de año usando la API.
 
     Obtiene todos los autos y luego filtra localmente por rango.
     """
-    autos = obtener_autos_api()
-    if not autos:
-        # El mensaje ya se mostró en obtener_autos_api
-        return
     filtrar_año(autos)
 
 
 def filtrar_transmision_api(transmision: str):
     """Filtra autos por transmisión usando la API.
 
+    Si el catálogo completo todavía no está en memoria, primero se le pide al
+    servidor solo esa transmisión (parámetro `Transmisión` de `/autos`). El
+    filtro se verifica igual en memoria, porque la API puede ignorar el
+    parámetro o comparar distinto (acentos, mayúsculas, coincidencia parcial);
+    si así no aparece nada, se filtra el catálogo completo.
+
     Args:
         transmision (str): Tipo de transmisión a filtrar.
     """
-    autos = obtener_autos_api()
-    if not autos:
-        # El mensaje ya se mostró en obtener_autos_api
-        return
-    # Filtrar localmente porque puede no haber filtro directo en la API
-    resultados = [
-        a for a in autos
-        if normalizar(transmision) in normalizar(a.get("Transmisión", ""))
-    ]
-    if resultados:
+    _avisar_si_desconocido(transmision, _TRANSMISIONES_NORM, "tipo de transmisión")
+    transmision_norm = normalizar(transmision)
+
+    def coincidencias(autos):
+        return (
+            a for a in autos
+            if transmision_norm in normalizar(a.get("Transmisión", ""))
+        )
+
+    # Se pide solo el primer resultado para saber si hay alguno; el resto se
+    # imprime a medida que se recorre, sin armar una lista intermedia.
+    primero = None
+    if api_client.autos_en_memoria() is None:
+        try:
+            candidatos = coincidencias(api_client.listar_autos(transmision=transmision))
+            primero = next(candidatos, None)
+        except Exception:
+            primero = None
+
+    if primero is None:
+        autos = obtener_autos_api()
+        if not autos:
+            # El mensaje ya se mostró en obtener_autos_api
+            return
+        candidatos = coincidencias(autos)
+        primero = next(candidatos, None)
+
+    if primero is not None:
         print(f"\n Autos con transmisión '{transmision}':")
-        mostrar_autos(resultados)
+        mostrar_autos_iterable(chain((primero,), candidatos))
     else:
         print(f"\n No se encontraron autos con transmisión '{transmision}'.")
 
 
-def ordenar_autos_api(campo: str, descendente: bool = False):
-    """Ordena autos usando la API.
+@_con_catalogo
+def ordenar_autos_api(autos, campo: str, descendente: bool = False):
+    """Ordena autos del catálogo obtenido de la API.
 
     Args:
+        autos (list[dict]): Catálogo de la API (lo pasa `_con_catalogo`).
         campo (str): Campo de ordenamiento (Marca, Modelo, Año, TipoCombustible, Transmisión).
         descendente (bool): Si True, orden descendente.
     """
-    autos = obtener_autos_api(sort_by=campo, desc=descendente)
-    if not autos:
-        # El mensaje ya se mostró en obtener_autos_api
-        return
     ordenar_autos(autos, campo, descendente)
 
 
-def estadisticas_api():
+@_con_catalogo
+def estadisticas_api(autos):
     """Muestra estadísticas de autos obtenidos desde la API."""
-    autos = obtener_autos_api()
-    if not autos:
-        # El mensaje ya se mostró en obtener_autos_api
-        return
     mostrar_estadisticas(autos)
 
 
-def agregar_auto_api():
-    """Agrega un auto nuevo usando la API."""
-    print("\n--- Agregar nuevo auto (API) ---")
-    marca = input("Marca del auto: ").strip()
+def _mostrar_opciones(autos, con_id=False):
+    """Muestra los autos numerados desde 1 para que el usuario elija uno.
+
+    Cada campo se lee una sola vez por auto y todo el listado se imprime de
+    una vez.
+
+    Args:
+        autos (list[dict]): Autos a listar.
+        con_id (bool): Si True, muestra también el ID del servidor.
+    """
+    lineas = []
+    for i, a in enumerate(autos, 1):
+        marca = a.get("Marca", "")
+        modelo = a.get("Modelo", "")
+        año = a.get("Año", "")
+        comb = a.get("TipoCombustible", "")
+        trans = a.get("Transmisión", "")
+        prefijo = f"{i}. [ID: {a.get('id', 'N/A')}]" if con_id else f"{i}."
+        lineas.append(
+            f"{prefijo} {marca} {modelo} | Año: {año} | "
+            f"Combustible: {comb} | Transmisión: {trans}"
+        )
+    print("\n".join(lineas))
+
+
+def _pedir_auto():
+    """Pide por consola los datos de un auto nuevo.
+
+    Returns:
+        dict: Auto con las claves del CSV.
+    """
+    marca = leer("Marca del auto: ").strip()
     while marca == "":
-        marca = input("La marca no puede estar vacía. Ingresá nuevamente: ").strip()
+        marca = leer("La marca no puede estar vacía. Ingresá nuevamente: ").strip()
 
-    modelo = input("Modelo del auto: ").strip()
+    modelo = leer("Modelo del auto: ").strip()
     while modelo == "":
-        modelo = input("El modelo no puede estar vacío. Ingresá nuevamente: ").strip()
+        modelo = leer("El modelo no puede estar vacío. Ingresá nuevamente: ").strip()
 
-    try:
-        año = int(input("Año: "))
-        while año < 1900 or año > 2100:
-            año = int(input("Año inválido. Ingresá un año entre 1900 y 2100: "))
-    except ValueError:
-        print("Error: El año debe ser numérico.")
-        return
+    # Se valida con isdigit() en lugar de capturar ValueError: un texto no
+    # numérico se vuelve a pedir igual que un año fuera de rango.
+    texto_año = leer("Año: ").strip()
+    while not (texto_año.isdigit() and 1900 <= int(texto_año) <= 2100):
+        texto_año = leer("Año inválido. Ingresá un año entre 1900 y 2100: ").strip()
+    año = int(texto_año)
 
-    tipo_combustible = input("Tipo de combustible (Nafta, Diesel, Híbrido, Eléctrico): ").strip()
+    tipo_combustible = leer("Tipo de combustible (Nafta, Diesel, Híbrido, Eléctrico): ").strip()
     while tipo_combustible == "":
-        tipo_combustible = input(
+        tipo_combustible = leer(
             "El tipo de combustible no puede estar vacío. Ingresá nuevamente: "
         ).strip()
 
-    transmision = input("Transmisión (Manual, Automática): ").strip()
+    transmision = leer("Transmisión (Manual, Automática): ").strip()
     while transmision == "":
-        transmision = input(
+        transmision = leer(
             "La transmisión no puede estar vacía. Ingresá nuevamente: "
         ).strip()
 
+    return {
+        "Marca": marca,
+        "Modelo": modelo,
+        "Año": año,
+        "TipoCombustible": tipo_combustible,
+        "Transmisión": transmision,
+    }
+
+
+def agregar_auto_api():
+    """Agrega un auto nuevo usando la API."""
+    print("\n--- Agregar nuevo auto (API) ---")
+    auto = _pedir_auto()
+
     try:
-        auto_api = api_client.crear_auto(
-            marca=marca,
-            modelo=modelo,
-            año=año,
-            tipo_combustible=tipo_combustible,
-            transmision=transmision,
-        )
-        print(f"Auto '{marca} {modelo}' creado correctamente en el servidor.")
+        creado = api_client.crear_desde_dict(auto)
+        print(f"Auto '{auto['Marca']} {auto['Modelo']}' creado correctamente en el servidor.")
+
+        # Sincronizar estructura jerárquica local después de crear en API
+        _programar_sincronizacion(altas=[creado])
+    except Exception as e:
+        print(f"Error al crear el auto: {e}")
+
+
+def agregar_varios_autos_api():
+    """Agrega varios autos nuevos usando la API.
+
+    Los datos se piden de a un auto; al terminar, todos se envían juntos
+    (`api_client.crear_autos_bulk`) y se sincroniza el CSV local una sola vez.
+    """
+    print("\n--- Agregar varios autos (API) ---")
+    nuevos = []
+    while True:
+        nuevos.append(_pedir_auto())
+        otro = leer("¿Agregar otro auto? (s/n): ").strip().lower()
+        if otro != "s":
+            break
+
+    try:
+        creados = api_client.crear_autos_bulk(nuevos)
+        for auto in nuevos:
+            print(f"Auto '{auto['Marca']} {auto['Modelo']}' creado correctamente en el servidor.")
         
         # Sincronizar estructura jerárquica local después de crear en API
-        _sincronizar_api_con_local()
+        _programar_sincronizacion(altas=creados)
     except Exception as e:
         print(f"Error al crear el auto: {e}")
 
@@ -218,33 +438,23 @@ def agregar_auto_api():
 def editar_auto_api():
     """Edita un auto usando la API."""
     print("\n--- Editar auto (API) ---")
-    busqueda = input("Ingresá la marca o modelo del auto que querés editar: ").strip()
+    busqueda = leer("Ingresá la marca o modelo del auto que querés editar: ").strip()
     if not busqueda:
         print("Búsqueda vacía, cancelado.")
         return
 
-    autos = obtener_autos_api(q=busqueda)
-    busqueda_norm = normalizar(busqueda)
-    resultados = [
-        a for a in autos
-        if busqueda_norm in normalizar(a.get("Marca", "")) or busqueda_norm in normalizar(a.get("Modelo", ""))
-    ]
+    # El servidor ya filtra por marca o modelo con `q`.
+    resultados = obtener_autos_api(q=busqueda)
 
     if not resultados:
         print(f" No se encontró ningún auto que contenga '{busqueda}'.")
         return
 
     print(f"\nSe encontraron {len(resultados)} auto(s):")
-    for i, a in enumerate(resultados, 1):
-        print(
-            f"{i}. {a.get('Marca', '')} {a.get('Modelo', '')} | "
-            f"Año: {a.get('Año', '')} | "
-            f"Combustible: {a.get('TipoCombustible', '')} | "
-            f"Transmisión: {a.get('Transmisión', '')}"
-        )
+    _mostrar_opciones(resultados)
 
     try:
-        indice = int(input("Elegí el número del auto que querés editar: ")) - 1
+        indice = int(leer("Elegí el número del auto que querés editar: ")) - 1
         if indice < 0 or indice >= len(resultados):
             print(" Número inválido.")
             return
@@ -256,30 +466,26 @@ def editar_auto_api():
 
         cambios = {}
 
-        nuevo_modelo = input(f"Nuevo modelo [{auto.get('Modelo', '')}]: ").strip()
+        nuevo_modelo = leer(f"Nuevo modelo [{auto.get('Modelo', '')}]: ").strip()
         if nuevo_modelo:
             cambios["Modelo"] = nuevo_modelo
 
-        nuevo_combustible = input(f"Nuevo tipo de combustible [{auto.get('TipoCombustible', '')}]: ").strip()
+        nuevo_combustible = leer(f"Nuevo tipo de combustible [{auto.get('TipoCombustible', '')}]: ").strip()
         if nuevo_combustible:
             cambios["TipoCombustible"] = nuevo_combustible
 
-        nueva_transmision = input(f"Nueva transmisión [{auto.get('Transmisión', '')}]: ").strip()
+        nueva_transmision = leer(f"Nueva transmisión [{auto.get('Transmisión', '')}]: ").strip()
         if nueva_transmision:
             cambios["Transmisión"] = nueva_transmision
 
-        try:
-            nuevo_año = input(f"Nuevo año [{auto.get('Año', '')}]: ").strip()
-            if nuevo_año:
-                año_int = int(nuevo_año)
-                if 1900 <= año_int <= 2100:
-                    cambios["Año"] = año_int
-                else:
-                    print("Año inválido. Se mantiene el valor anterior.")
-        except ValueError:
-            print("Año inválido. Se mantiene el valor anterior.")
-
-        nueva_marca = input(f"Nueva marca [{auto.get('Marca', '')}]: ").strip()
+        nuevo_año = leer(f"Nuevo año [{auto.get('Año', '')}]: ").strip()
+        if nuevo_año:
+            if nuevo_año.isdigit() and 1900 <= int(nuevo_año) <= 2100:
+                cambios["Año"] = int(nuevo_año)
+            else:
+                print("Año inválido. Se mantiene el valor anterior.")
+
+        nueva_marca = leer(f"Nueva marca [{auto.get('Marca', '')}]: ").strip()
         if nueva_marca:
             cambios["Marca"] = nueva_marca
 
@@ -294,11 +500,15 @@ def editar_auto_api():
             return
 
         try:
-            api_client.actualizar_auto_parcial(auto_id, cambios)
-            print(f"Datos actualizados para {auto.get('Marca', '')} {auto.get('Modelo', '')}.")
-            
-            # Sincronizar estructura jerárquica local después de actualizar en API
-            _sincronizar_api_con_local()
+            # La edición se encola y se envía al servidor junto con otras
+            # (ver `api_client.encolar_cambio`); el catálogo en memoria ya la refleja.
+            api_client.encolar_cambio(auto_id, cambios)
+            if api_client.hay_cambios_pendientes():
+                print(f"Cambio pendiente de envío para {auto.get('Marca', '')} {auto.get('Modelo', '')}.")
+            else:
+                # Al llenarse la cola se envió todo: ya se puede sincronizar el CSV
+                print(f"Datos actualizados para {auto.get('Marca', '')} {auto.get('Modelo', '')}.")
+                _programar_sincronizacion()
         except Exception as e:
             print(f"Error al actualizar: {e}")
 
@@ -306,10 +516,25 @@ def editar_auto_api():
         print("Entrada inválida.")
 
 
+def guardar_cambios_api():
+    """Envía al servidor las ediciones que quedaron encoladas.
+
+    También espera a que termine la sincronización del CSV local, para que el
+    modo local no lo lea o escriba mientras tanto.
+    """
+    try:
+        if api_client.vaciar_cambios():
+            # Recién ahora el servidor tiene las ediciones: se pasan al CSV local
+            _programar_sincronizacion()
+    except Exception as e:
+        print(f"Error al enviar los cambios pendientes: {e}")
+    esperar_sincronizacion()
+
+
 def borrar_auto_api() -> None:
     """Borra un auto usando la API por marca/modelo."""
     print("\n--- Borrar auto (API) ---")
-    busqueda = input("Ingresá la marca o modelo (o parte): ").strip()
+    busqueda = leer("Ingresá la marca o modelo (o parte): ").strip()
     if not busqueda:
         print("Búsqueda vacía, cancelado.")
         return
@@ -321,17 +546,10 @@ def borrar_auto_api() -> None:
 
     # Mostrar autos con ID para que el usuario pueda verlo
     print(f"\nSe encontraron {len(autos)} auto(s):")
-    for i, a in enumerate(autos, 1):
-        auto_id = a.get("id", "N/A")
-        print(
-            f"{i}. [ID: {auto_id}] {a.get('Marca', '')} {a.get('Modelo', '')} | "
-            f"Año: {a.get('Año', '')} | "
-            f"Combustible: {a.get('TipoCombustible', '')} | "
-            f"Transmisión: {a.get('Transmisión', '')}"
-        )
+    _mostrar_opciones(autos, con_id=True)
 
     try:
-        idx = int(input("\nElegí el número del auto a borrar (1..n): ").strip()) - 1
+        idx = int(leer("\nElegí el número del auto a borrar (1..n): ").strip()) - 1
         if idx < 0 or idx >= len(autos):
             print("Número inválido.")
             return
@@ -347,7 +565,7 @@ def borrar_auto_api() -> None:
         return
 
     confirma = (
-        input(
+        leer(
             f"¿Confirmás borrar '{elegido.get('Marca', '')} {elegido.get('Modelo', '')}' (id={auto_id})? (s/n): "
         )
         .strip()
@@ -363,6 +581,6 @@ def borrar_auto_api() -> None:
         print(f"'{elegido.get('Marca', '')} {elegido.get('Modelo', '')}' borrado correctamente (API).")
         
         # Sincronizar estructura jerárquica local después de borrar en API
-        _sincronizar_api_con_local()
+        _programar_sincronizacion()
     except Exception as e:
         print(f"Error al borrar: {e}")
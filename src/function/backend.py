@@ -0,0 +1,201 @@
+"""Fuentes de datos intercambiables para el menú principal.
+
+El menú no pregunta en cada opción si está en modo local o API: al elegir el
+modo se crea un objeto `Backend` y todas las opciones llaman a sus métodos.
+
+- `LocalBackend`: trabaja sobre la lista `autos` en memoria y el CSV local.
+- `ApiBackend`: usa las funciones de `function.api_mode` contra el servidor.
+"""
+
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+
+from function.tools import escribir_csv, append_csv, leer
+from function.data_load import agregar_auto, editar_auto, borrar_auto
+from function.shearch import buscar_auto, filtrar_combustible, filtrar_año, filtrar_transmision
+from function.view import ordenar_autos
+from function.statistics import mostrar_estadisticas
+from function import api_mode
+
+
+class Backend(ABC):
+    """Operaciones del menú principal, comunes a ambos modos.
+
+    Es una clase abstracta: un backend que no implemente todas las
+    operaciones falla al crearse, no a mitad del menú.
+    """
+
+    @abstractmethod
+    def buscar(self, busqueda):
+        """Busca autos por marca o modelo (opción 1)."""
+
+    @abstractmethod
+    def filtrar_combustible(self, tipo_combustible):
+        """Filtra autos por tipo de combustible (opción 2)."""
+
+    @abstractmethod
+    def filtrar_año(self):
+        """Filtra autos por rango de año pidiendo el rango por consola (opción 3)."""
+
+    @abstractmethod
+    def filtrar_transmision(self, transmision):
+        """Filtra autos por transmisión (opción 4)."""
+
+    @abstractmethod
+    def ordenar(self, campo, descendente):
+        """Ordena y muestra los autos por `campo` (opción 5)."""
+
+    @abstractmethod
+    def estadisticas(self):
+        """Muestra estadísticas generales (opción 6)."""
+
+    @abstractmethod
+    def agregar(self):
+        """Agrega un auto pidiendo los datos por consola (opción 7)."""
+
+    @abstractmethod
+    def agregar_varios(self):
+        """Agrega varios autos seguidos pidiendo los datos por consola (opción 11)."""
+
+    @abstractmethod
+    def editar(self):
+        """Edita un auto elegido por consola (opción 8)."""
+
+    @abstractmethod
+    def borrar(self):
+        """Borra un auto elegido por consola (opción 9)."""
+
+    def guardar_pendientes(self):
+        """Persiste los cambios que aún no se guardaron. Por defecto no hace nada."""
+
+
+class LocalBackend(Backend):
+    """Modo local: lista `autos` en memoria persistida en el CSV `db_path`.
+
+    Las altas se agregan al final del CSV en el momento. Las ediciones y bajas
+    se acumulan y se escriben con una sola reescritura cada `persistir_cada`
+    cambios o al llamar a `guardar_pendientes()`.
+
+    `autos` puede recibirse como un `Future` (el CSV se lee en segundo plano);
+    se espera su resultado recién en la primera operación que lo necesita, y
+    en ese momento se imprimen los `avisos` que haya dejado la lectura.
+
+    Attributes:
+        autos (list[dict]): Autos cargados desde el CSV.
+        db_path (str): Ruta del CSV local.
+        persistir_cada (int): Cambios acumulados que disparan la escritura.
+        cambios_pendientes (int): Ediciones/bajas aún no escritas.
+    """
+
+    def __init__(self, autos, db_path, persistir_cada=5, avisos=None):
+        self._autos = autos
+        self._avisos = avisos
+        self.db_path = db_path
+        self.persistir_cada = persistir_cada
+        self.cambios_pendientes = 0
+
+    @property
+    def autos(self):
+        """Lista de autos; si todavía se está leyendo el CSV, espera a que termine."""
+        if isinstance(self._autos, Future):
+            self._autos = self._autos.result()
+            if self._avisos:
+                print("\n".join(self._avisos))
+                self._avisos.clear()
+        return self._autos
+
+    def buscar(self, busqueda):
+        buscar_auto(self.autos, busqueda)
+
+    def filtrar_combustible(self, tipo_combustible):
+        filtrar_combustible(self.autos, tipo_combustible)
+
+    def filtrar_año(self):
+        filtrar_año(self.autos)
+
+    def filtrar_transmision(self, transmision):
+        filtrar_transmision(self.autos, transmision)
+
+    def ordenar(self, campo, descendente):
+        ordenar_autos(self.autos, campo, descendente)
+
+    def estadisticas(self):
+        mostrar_estadisticas(self.autos)
+
+    def agregar(self):
+        nuevo_auto = agregar_auto(self.autos)
+        if nuevo_auto:
+            append_csv(self.db_path, nuevo_auto)
+            api_mode.olvidar_huella()
+
+    def agregar_varios(self):
+        while True:
+            self.agregar()
+            if leer("¿Agregar otro auto? (s/n): ").strip().lower() != "s":
+                break
+
+    def editar(self):
+        if editar_auto(self.autos):
+            self._registrar_cambio()
+
+    def borrar(self):
+        if borrar_auto(self.autos):
+            self._registrar_cambio()
+
+    def _registrar_cambio(self):
+        """Cuenta una edición/baja y persiste si se alcanzó el límite."""
+        self.cambios_pendientes += 1
+        if self.cambios_pendientes >= self.persistir_cada:
+            self.guardar_pendientes()
+
+    def guardar_pendientes(self):
+        """Escribe `autos` en el CSV si hay ediciones o bajas sin persistir.
+
+        De los subgrupos jerárquicos se reescriben solo los afectados.
+        """
+        if self.cambios_pendientes:
+            escribir_csv(self.db_path, self.autos, incremental=True)
+            self.cambios_pendientes = 0
+            # El CSV ya no refleja el último catálogo de la API escrito en él
+            api_mode.olvidar_huella()
+
+
+class ApiBackend(Backend):
+    """Modo API: cada operación se resuelve con `function.api_mode`.
+
+    Las ediciones se encolan y se envían juntas; `guardar_pendientes()` manda
+    las que queden al cambiar de modo o salir.
+    """
+
+    def buscar(self, busqueda):
+        api_mode.buscar_auto_api(busqueda)
+
+    def filtrar_combustible(self, tipo_combustible):
+        api_mode.filtrar_combustible_api(tipo_combustible)
+
+    def filtrar_año(self):
+        api_mode.filtrar_año_api()
+
+    def filtrar_transmision(self, transmision):
+        api_mode.filtrar_transmision_api(transmision)
+
+    def ordenar(self, campo, descendente):
+        api_mode.ordenar_autos_api(campo, descendente)
+
+    def estadisticas(self):
+        api_mode.estadisticas_api()
+
+    def agregar(self):
+        api_mode.agregar_auto_api()
+
+    def agregar_varios(self):
+        api_mode.agregar_varios_autos_api()
+
+    def editar(self):
+        api_mode.editar_auto_api()
+
+    def borrar(self):
+        api_mode.borrar_auto_api()
+
+    def guardar_pendientes(self):
+        api_mode.guardar_cambios_api()
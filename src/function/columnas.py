@@ -0,0 +1,329 @@
+"""Vista columnar (una lista por campo) de una lista de autos.
+
+Los filtros y el ordenamiento recorren un solo campo de cada auto. En lugar de
+entrar a cada diccionario en cada consulta, este módulo arma una vez una
+"tabla" con una columna por campo y la reutiliza mientras la lista no cambie:
+
+- 'Marca', 'Modelo', 'TipoCombustible', 'Transmisión': list[str]
+- 'Año': array('i') con los años como enteros (-1 si falta o no es numérico)
+
+La posición `i` de cada columna corresponde a `autos[i]`. Los diccionarios
+siguen siendo la fuente de verdad (se muestran y se guardan en el CSV); la
+tabla es solo un índice auxiliar.
+
+Las funciones que modifican la lista en memoria deben avisarlo: las altas con
+`registrar_alta()` (actualiza la tabla sin reconstruirla) y las ediciones y
+bajas con `invalidar()` (la tabla se reconstruye en la próxima consulta).
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, defaultdict
+from function.tools import normalizar
+
+
+CAMPOS_TEXTO = ["Marca", "Modelo", "TipoCombustible", "Transmisión"]
+
+# Separadores del texto de búsqueda de marca y modelo (ver `posiciones_marca_o_modelo`).
+_SEP_CAMPO = "\x1f"
+_SEP_AUTO = "\n"
+
+# Tabla de la última lista consultada. Se guarda la referencia a la lista
+# para reconocerla por identidad y la versión para detectar modificaciones.
+_version = 0
+_cache = {"autos": None, "version": -1, "tabla": None}
+
+
+def _año_entero(valor):
+    """Convierte el año de un auto a int para la columna 'Año'.
+
+    Los autos del CSV ya traen el año como int, pero los de la API pueden
+    traerlo nulo o como texto: esos valores (y los que no entran en un
+    `array('i')`) se guardan como -1, igual que un año faltante.
+    """
+    try:
+        año = int(valor)
+    except (TypeError, ValueError):
+        return -1
+    return año if -2**31 <= año < 2**31 else -1
+
+
+def invalidar():
+    """Marca como desactualizada la tabla de la lista en memoria.
+
+    Debe llamarse después de editar o borrar autos de la lista.
+    """
+    global _version
+    _version += 1
+
+
+def registrar_alta(autos, auto):
+    """Agrega a la tabla vigente el auto recién agregado al final de `autos`.
+
+    Si la tabla en cache no corresponde a `autos` (o ya estaba desactualizada)
+    se invalida y se reconstruirá completa en la próxima consulta.
+
+    Args:
+        autos (list[dict]): Lista a la que se le agregó `auto` al final.
+        auto (dict): Auto agregado.
+    """
+    if _cache["autos"] is not autos or _cache["version"] != _version:
+        invalidar()
+        return
+
+    tabla = _cache["tabla"]
+    for campo in CAMPOS_TEXTO:
+        tabla[campo].append(auto.get(campo, ""))
+    tabla["Año"].append(_año_entero(auto.get("Año")))
+    for campo, valores in tabla["normalizadas"].items():
+        valores.append(normalizar(str(auto.get(campo, ""))))
+    for campo, indice in tabla["indices"].items():
+        indice[normalizar(str(auto.get(campo, "")))].append(len(autos) - 1)
+    if tabla["por_año"] is not None:
+        insort(tabla["por_año"], (tabla["Año"][-1], len(autos) - 1))
+    # El texto de búsqueda y los conteos se vuelven a armar en la próxima
+    # consulta y la última búsqueda deja de valer (el auto nuevo podría coincidir)
+    tabla["corpus"] = None
+    tabla["ultima_busqueda"] = None
+    tabla["conteos"] = {}
+
+
+def obtener_tabla(autos):
+    """Devuelve la tabla columnar de `autos`, armándola solo si hace falta.
+
+    Args:
+        autos (list[dict]): Lista de autos.
+
+    Returns:
+        dict: Columnas por campo ('Marca', 'Modelo', 'Año', 'TipoCombustible',
+        'Transmisión'), un dict interno 'normalizadas' para las versiones
+        normalizadas, un dict 'indices' con los índices invertidos por campo,
+        el índice 'por_año', el texto de búsqueda 'corpus', el resultado de
+        la 'ultima_busqueda' y los 'conteos' ordenados por campo; estos seis
+        últimos se calculan a pedido.
+    """
+    if _cache["autos"] is autos and _cache["version"] == _version:
+        return _cache["tabla"]
+
+    tabla = {campo: [a.get(campo, "") for a in autos] for campo in CAMPOS_TEXTO}
+    tabla["Año"] = array("i", (_año_entero(a.get("Año")) for a in autos))
+    tabla["normalizadas"] = {}
+    tabla["indices"] = {}
+    tabla["por_año"] = None
+    tabla["corpus"] = None
+    tabla["ultima_busqueda"] = None
+    tabla["conteos"] = {}
+
+    _cache["autos"] = autos
+    _cache["version"] = _version
+    _cache["tabla"] = tabla
+    return tabla
+
+
+def columna_normalizada(autos, campo):
+    """Devuelve la columna `campo` normalizada (sin acentos, en minúsculas).
+
+    Se calcula una sola vez por tabla y se reutiliza en las siguientes
+    búsquedas y ordenamientos.
+
+    Args:
+        autos (list[dict]): Lista de autos.
+        campo (str): Campo de texto ('Marca', 'Modelo', 'TipoCombustible' o 'Transmisión').
+
+    Returns:
+        list[str]: Valores normalizados en el mismo orden que `autos`.
+    """
+    tabla = obtener_tabla(autos)
+    normalizadas = tabla["normalizadas"]
+    if campo not in normalizadas:
+        normalizadas[campo] = [normalizar(str(v)) for v in tabla[campo]]
+    return normalizadas[campo]
+
+
+def indice_por_valor(autos, campo):
+    """Devuelve un índice invertido valor normalizado -> posiciones en `autos`.
+
+    Los campos con pocos valores distintos (combustible, transmisión) o las
+    coincidencias exactas de modelo se resuelven consultando este índice en
+    lugar de recorrer la lista.
+
+    Args:
+        autos (list[dict]): Lista de autos.
+        campo (str): Campo de texto ('Marca', 'Modelo', 'TipoCombustible' o 'Transmisión').
+
+    Returns:
+        dict[str, list[int]]: Posiciones de los autos para cada valor del campo.
+    """
+    tabla = obtener_tabla(autos)
+    indices = tabla["indices"]
+    if campo not in indices:
+        indice = defaultdict(list)
+        for i, valor in enumerate(columna_normalizada(autos, campo)):
+            indice[valor].append(i)
+        indices[campo] = indice
+    return indices[campo]
+
+
+def indice_por_modelo(autos):
+    """Devuelve un índice modelo normalizado -> posiciones en `autos`.
+
+    Permite ubicar coincidencias exactas de modelo sin recorrer la lista.
+
+    Args:
+        autos (list[dict]): Lista de autos.
+
+    Returns:
+        dict[str, list[int]]: Posiciones de los autos para cada modelo.
+    """
+    return indice_por_valor(autos, "Modelo")
+
+
+def posiciones_que_contienen(autos, campo, texto_norm):
+    """Devuelve las posiciones de los autos cuyo `campo` contiene `texto_norm`.
+
+    Se prueba la coincidencia (parcial, como en los filtros) sobre los valores
+    distintos del índice invertido y no sobre cada auto: para combustible o
+    transmisión son unos pocos valores aunque la lista tenga miles de autos.
+
+    Args:
+        autos (list[dict]): Lista de autos.
+        campo (str): Campo de texto a consultar.
+        texto_norm (str): Texto ya normalizado (ver `tools.normalizar`).
+
+    Returns:
+        list[int]: Posiciones en `autos`, en el mismo orden que la lista.
+    """
+    grupos = [
+        posiciones
+        for valor, posiciones in indice_por_valor(autos, campo).items()
+        if texto_norm in valor
+    ]
+    if len(grupos) == 1:
+        return list(grupos[0])
+    return sorted(p for posiciones in grupos for p in posiciones)
+
+
+def posiciones_en_rango_año(autos, minimo, maximo):
+    """Devuelve las posiciones de los autos con año entre `minimo` y `maximo`.
+
+    Usa un índice de pares (año, posición) ordenado, armado una sola vez por
+    tabla: cada consulta son dos búsquedas binarias (`bisect`) en lugar de
+    recorrer todos los años.
+
+    Args:
+        autos (list[dict]): Lista de autos.
+        minimo (int): Año mínimo (inclusive).
+        maximo (int): Año máximo (inclusive).
+
+    Returns:
+        list[int]: Posiciones en `autos`, en el mismo orden que la lista.
+    """
+    tabla = obtener_tabla(autos)
+    if tabla["por_año"] is None:
+        tabla["por_año"] = sorted(zip(tabla["Año"], range(len(autos))))
+    por_año = tabla["por_año"]
+    desde = bisect_left(por_año, (minimo, -1))
+    hasta = bisect_right(por_año, (maximo, len(autos)))
+    return sorted(posicion for _, posicion in por_año[desde:hasta])
+
+
+def posiciones_marca_o_modelo(autos, texto_norm):
+    """Devuelve las posiciones de los autos cuya marca o modelo contiene `texto_norm`.
+
+    Las marcas y modelos normalizados se unen una vez por tabla en un solo
+    texto ("marca<US>modelo" por línea) y cada búsqueda lo recorre con
+    `str.find`, implementado en C, saltando a la línea siguiente después de
+    cada coincidencia. Las posiciones de inicio de cada línea permiten pasar
+    de la ubicación en el texto al auto con `bisect`.
+
+    Se recuerda la última búsqueda de la tabla: si el texto nuevo la contiene
+    (el usuario agregó letras), solo se revisan los autos que ya coincidían.
+
+    Args:
+        autos (list[dict]): Lista de autos.
+        texto_norm (str): Texto ya normalizado (ver `tools.normalizar`).
+
+    Returns:
+        list[int]: Posiciones en `autos`, en el mismo orden que la lista.
+    """
+    if not texto_norm:
+        return list(range(len(autos)))
+
+    tabla = obtener_tabla(autos)
+    ultima = tabla["ultima_busqueda"]
+    if ultima is not None and ultima[0] in texto_norm:
+        # Búsqueda refinada ("toy" -> "toyo"): todo lo que contiene el texto
+        # nuevo contiene también el anterior, así que alcanza con revisar los
+        # resultados previos en lugar de toda la lista.
+        marcas = columna_normalizada(autos, "Marca")
+        modelos = columna_normalizada(autos, "Modelo")
+        posiciones = [
+            i for i in ultima[1]
+            if texto_norm in marcas[i] or texto_norm in modelos[i]
+        ]
+        tabla["ultima_busqueda"] = (texto_norm, posiciones)
+        return list(posiciones)
+
+    posiciones = _buscar_marca_o_modelo(autos, tabla, texto_norm)
+    tabla["ultima_busqueda"] = (texto_norm, posiciones)
+    return list(posiciones)
+
+
+def _buscar_marca_o_modelo(autos, tabla, texto_norm):
+    """Recorre toda la lista para `posiciones_marca_o_modelo` (sin usar la última búsqueda)."""
+    if _SEP_CAMPO in texto_norm or _SEP_AUTO in texto_norm:
+        # Una coincidencia así cruzaría de un campo a otro: se compara auto por auto
+        return [
+            i for i, (marca, modelo) in enumerate(zip(
+                columna_normalizada(autos, "Marca"),
+                columna_normalizada(autos, "Modelo"),
+            ))
+            if texto_norm in marca or texto_norm in modelo
+        ]
+
+    if tabla["corpus"] is None:
+        lineas = [
+            marca + _SEP_CAMPO + modelo
+            for marca, modelo in zip(
+                columna_normalizada(autos, "Marca"),
+                columna_normalizada(autos, "Modelo"),
+            )
+        ]
+        inicios = []
+        inicio = 0
+        for linea in lineas:
+            inicios.append(inicio)
+            inicio += len(linea) + 1
+        tabla["corpus"] = (_SEP_AUTO.join(lineas), inicios)
+
+    texto, inicios = tabla["corpus"]
+    ultima_linea = len(inicios) - 1
+    posiciones = []
+    encontrado = texto.find(texto_norm)
+    while encontrado != -1:
+        linea = bisect_right(inicios, encontrado) - 1
+        posiciones.append(linea)
+        if linea == ultima_linea:
+            break
+        encontrado = texto.find(texto_norm, inicios[linea + 1])
+    return posiciones
+
+
+def conteos_ordenados(autos, campo):
+    """Devuelve cuántos autos hay por cada valor de `campo`, ordenado por valor.
+
+    El resultado se guarda en la tabla: mostrar las estadísticas otra vez
+    sobre la misma lista sin cambios no vuelve a contar ni a ordenar.
+
+    Args:
+        autos (list[dict]): Lista de autos.
+        campo (str): Campo de texto ('Marca', 'Modelo', 'TipoCombustible' o 'Transmisión').
+
+    Returns:
+        list[tuple[str, int]]: Pares (valor, cantidad) ordenados por valor.
+    """
+    tabla = obtener_tabla(autos)
+    conteos = tabla["conteos"]
+    if campo not in conteos:
+        conteos[campo] = sorted(Counter(tabla[campo]).items())
+    return conteos[campo]
@@ -2,10 +2,27 @@
 
 Este módulo implementa altas, ediciones y borrados sobre la lista `autos`
 en memoria, solicitando los datos por consola y reutilizando utilidades de
-`function.tools` (por ejemplo, `normalizar`).
+`function.tools` (por ejemplo, `normalizar`). Cada modificación invalida la
+vista columnar de `function.columnas` y anota en `function.jerarquia` los
+subgrupos que habrá que reescribir al guardar.
 """
 
 from function.tools import *
+from function import columnas, jerarquia
+
+
+def _coincidencias(autos, busqueda):
+    """Posiciones de los autos cuya marca o modelo contiene `busqueda`.
+
+    Compara sin acentos ni mayúsculas con el mismo índice de búsqueda que
+    `buscar_auto` (ver `columnas.posiciones_marca_o_modelo`), que se arma una
+    sola vez por lista en lugar de normalizar cada auto en cada edición o
+    borrado.
+
+    Returns:
+        list[int]: Índices en `autos` de las coincidencias, en orden.
+    """
+    return columnas.posiciones_marca_o_modelo(autos, normalizar(busqueda))
 
 
 def agregar_auto(autos):
@@ -22,39 +39,39 @@ def agregar_auto(autos):
             `Transmisión` (str).
 
     Returns:
-        None
+        dict | None: El auto agregado, o None si se canceló por un dato inválido.
     """
     print("\n--- Agregar nuevo auto ---")
 
-    marca = input("Marca del auto: ").strip()
+    marca = leer("Marca del auto: ").strip()
     while marca == "":
-        marca = input(
+        marca = leer(
             "La marca no puede estar vacía. Ingresá nuevamente: "
         ).strip()
 
-    modelo = input("Modelo del auto: ").strip()
+    modelo = leer("Modelo del auto: ").strip()
     while modelo == "":
-        modelo = input(
+        modelo = leer(
             "El modelo no puede estar vacío. Ingresá nuevamente: "
         ).strip()
 
     try:
-        año = int(input("Año: "))
+        año = int(leer("Año: "))
         while año < 1900 or año > 2100:
-            año = int(input("Año inválido. Ingresá un año entre 1900 y 2100: "))
+            año = int(leer("Año inválido. Ingresá un año entre 1900 y 2100: "))
     except ValueError:
         print("Error: El año debe ser numérico.")
-        return
+        return None
 
-    tipo_combustible = input("Tipo de combustible (Nafta, Diesel, Híbrido, Eléctrico): ").strip()
+    tipo_combustible = leer("Tipo de combustible (Nafta, Diesel, Híbrido, Eléctrico): ").strip()
     while tipo_combustible == "":
-        tipo_combustible = input(
+        tipo_combustible = leer(
             "El tipo de combustible no puede estar vacío. Ingresá nuevamente: "
         ).strip()
 
-    transmision = input("Transmisión (Manual, Automática): ").strip()
+    transmision = leer("Transmisión (Manual, Automática): ").strip()
     while transmision == "":
-        transmision = input(
+        transmision = leer(
             "La transmisión no puede estar vacía. Ingresá nuevamente: "
         ).strip()
 
@@ -67,7 +84,9 @@ def agregar_auto(autos):
     }
 
     autos.append(nuevo_auto)
+    columnas.registrar_alta(autos, nuevo_auto)
     print(f"Auto '{marca} {modelo}' agregado correctamente.")
+    return nuevo_auto
 
 
 def editar_auto(autos):
@@ -80,23 +99,20 @@ def editar_auto(autos):
         autos (list[dict]): Lista mutable de autos. Se modifica in-place.
 
     Returns:
-        None
+        bool: True si se eligió un auto y se guardaron sus datos, False si se
+        canceló o no hubo selección válida.
     """
     print("\n--- Editar auto ---")
-    busqueda = input("Ingresá la marca o modelo del auto que querés editar: ").strip()
+    busqueda = leer("Ingresá la marca o modelo del auto que querés editar: ").strip()
     if not busqueda:
         print("Búsqueda vacía, cancelado.")
-        return
+        return False
 
-    busqueda_norm = normalizar(busqueda)
-    resultados = [
-        a for a in autos
-        if busqueda_norm in normalizar(a["Marca"]) or busqueda_norm in normalizar(a["Modelo"])
-    ]
+    resultados = [autos[i] for i in _coincidencias(autos, busqueda)]
 
     if not resultados:
         print(f" No se encontró ningún auto que contenga '{busqueda}'.")
-        return
+        return False
 
     print(f"\nSe encontraron {len(resultados)} auto(s):")
     for i, a in enumerate(resultados, 1):
@@ -108,26 +124,29 @@ def editar_auto(autos):
         )
 
     try:
-        indice = int(input("Elegí el número del auto que querés editar: ")) - 1
+        indice = int(leer("Elegí el número del auto que querés editar: ")) - 1
         if indice < 0 or indice >= len(resultados):
             print(" Número inválido.")
-            return
+            return False
 
         auto = resultados[indice]
 
+        # Los subgrupos actuales del auto se reescriben al guardar, aunque
+        # después se lo mueva a otros
+        jerarquia.marcar_modificado(auto)
         print(f"\nEditando: {auto['Marca']} {auto['Modelo']}")
         print("(Presiona Enter para mantener el valor actual)")
 
-        nueva_marca = input(f"Nueva marca [{auto['Marca']}]: ").strip()
+        nueva_marca = leer(f"Nueva marca [{auto['Marca']}]: ").strip()
         if nueva_marca:
             auto["Marca"] = nueva_marca
 
-        nuevo_modelo = input(f"Nuevo modelo [{auto['Modelo']}]: ").strip()
+        nuevo_modelo = leer(f"Nuevo modelo [{auto['Modelo']}]: ").strip()
         if nuevo_modelo:
             auto["Modelo"] = nuevo_modelo
 
         try:
-            nuevo_año = input(f"Nuevo año [{auto['Año']}]: ").strip()
+            nuevo_año = leer(f"Nuevo año [{auto['Año']}]: ").strip()
             if nuevo_año:
                 año_int = int(nuevo_año)
                 if 1900 <= año_int <= 2100:
@@ -137,18 +156,22 @@ def editar_auto(autos):
         except ValueError:
             print("Año inválido. Se mantiene el valor anterior.")
 
-        nuevo_combustible = input(f"Nuevo tipo de combustible [{auto['TipoCombustible']}]: ").strip()
+        nuevo_combustible = leer(f"Nuevo tipo de combustible [{auto['TipoCombustible']}]: ").strip()
         if nuevo_combustible:
             auto["TipoCombustible"] = nuevo_combustible
 
-        nueva_transmision = input(f"Nueva transmisión [{auto['Transmisión']}]: ").strip()
+        nueva_transmision = leer(f"Nueva transmisión [{auto['Transmisión']}]: ").strip()
         if nueva_transmision:
             auto["Transmisión"] = nueva_transmision
 
+        columnas.invalidar()
+        jerarquia.marcar_modificado(auto)
         print(f"Datos actualizados para {auto['Marca']} {auto['Modelo']}.")
+        return True
 
     except ValueError:
         print("Entrada inválida.")
+        return False
 
 
 def borrar_auto(autos) -> bool:
@@ -167,16 +190,13 @@ def borrar_auto(autos) -> bool:
         bool: True si se eliminó, False si se canceló o no hubo selección válida.
     """
     print("\n--- Borrar auto (LOCAL) ---")
-    busqueda = input("Ingresá la marca o modelo del auto (o parte): ").strip()
+    busqueda = leer("Ingresá la marca o modelo del auto (o parte): ").strip()
     if not busqueda:
         print("Búsqueda vacía, cancelado.")
         return False
 
-    busqueda_norm = normalizar(busqueda)
-    resultados = [
-        a for a in autos
-        if busqueda_norm in normalizar(a["Marca"]) or busqueda_norm in normalizar(a["Modelo"])
-    ]
+    posiciones = _coincidencias(autos, busqueda)
+    resultados = [autos[i] for i in posiciones]
 
     if not resultados:
         print(f"No se encontró ningún auto que contenga '{busqueda}'.")
@@ -192,7 +212,7 @@ def borrar_auto(autos) -> bool:
         )
 
     try:
-        idx = int(input("Elegí el número del auto a borrar: ").strip()) - 1
+        idx = int(leer("Elegí el número del auto a borrar: ").strip()) - 1
         if idx < 0 or idx >= len(resultados):
             print("Número inválido.")
             return False
@@ -202,7 +222,7 @@ def borrar_auto(autos) -> bool:
 
     objetivo = resultados[idx]
     confirma = (
-        input(f"Confirmás borrar '{objetivo['Marca']} {objetivo['Modelo']}'? (s/n): ")
+        leer(f"Confirmás borrar '{objetivo['Marca']} {objetivo['Modelo']}'? (s/n): ")
         .strip()
         .lower()
         == "s"
@@ -211,14 +231,10 @@ def borrar_auto(autos) -> bool:
         print("Operación cancelada.")
         return False
 
-    # Buscar y eliminar de la lista original
-    for i, a in enumerate(autos):
-        if (a["Marca"] == objetivo["Marca"] and
-            a["Modelo"] == objetivo["Modelo"] and
-            a["Año"] == objetivo["Año"]):
-            autos.pop(i)
-            print(f"'{objetivo['Marca']} {objetivo['Modelo']}' borrado correctamente (LOCAL).")
-            return True
-
-    print("No se pudo ubicar el registro en la lista original.")
-    return False
+    # `posiciones` guarda dónde está cada candidato: se borra directo, sin
+    # volver a recorrer la lista comparando campos.
+    autos.pop(posiciones[idx])
+    columnas.invalidar()
+    jerarquia.marcar_modificado(objetivo)
+    print(f"'{objetivo['Marca']} {objetivo['Modelo']}' borrado correctamente (LOCAL).")
+    return True
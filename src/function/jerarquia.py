@@ -13,9 +13,14 @@ del proyecto de tener una estructura de base de datos separada jerárquicamente.
 
 import os
 import csv
-import shutil
+import functools
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from function import tools
+
 
 def obtener_ruta_subgrupos(ruta_db_central: str) -> Path:
     """Obtiene la ruta base para los subgrupos jerárquicos.
@@ -51,10 +56,18 @@ def inicializar_estructura_jerarquica(ruta_db_central: str) -> None:
         carpeta.mkdir(parents=True, exist_ok=True)
 
 
+# Caracteres no válidos en nombres de archivo: todos se reemplazan por "-"
+# en una sola pasada con `str.translate`.
+_CARACTERES_INVALIDOS = str.maketrans({c: "-" for c in '/\\:*?"<>|'})
+
+
+@functools.lru_cache(maxsize=512)
 def limpiar_nombre_archivo(nombre: str) -> str:
     """Limpia un nombre para usarlo como nombre de archivo.
 
-    Elimina caracteres especiales y normaliza espacios.
+    Elimina caracteres especiales y normaliza espacios. Los resultados se
+    memorizan: los mismos nombres de marca o combustible se repiten en cada
+    sincronización.
 
     Args:
         nombre (str): Nombre a limpiar.
@@ -62,15 +75,90 @@ def limpiar_nombre_archivo(nombre: str) -> str:
     Returns:
         str: Nombre limpio para archivo.
     """
-    # Reemplazar caracteres problemáticos
-    nombre = nombre.replace("/", "-").replace("\\", "-")
-    nombre = nombre.replace(":", "-").replace("*", "-")
-    nombre = nombre.replace("?", "-").replace('"', "-")
-    nombre = nombre.replace("<", "-").replace(">", "-")
-    nombre = nombre.replace("|", "-").strip()
+    nombre = nombre.translate(_CARACTERES_INVALIDOS).strip()
     return nombre if nombre else "SinNombre"
 
 
+CAMPOS = ["Marca", "Modelo", "Año", "TipoCombustible", "Transmisión"]
+
+# Criterios de agrupamiento: (subcarpeta, campo del auto, valor si falta).
+CRITERIOS = [
+    ("por_marca", "Marca", "Desconocida"),
+    ("por_combustible", "TipoCombustible", "Desconocido"),
+    ("por_transmision", "Transmisión", "Desconocida"),
+]
+
+
+# Subgrupos (subcarpeta, valor) tocados desde la última sincronización y
+# lista que se sincronizó por última vez. Con ambos, guardar de nuevo la misma
+# lista reescribe solo los archivos afectados (ver `marcar_modificado`).
+_grupos_modificados = set()
+_ultima_lista = None
+
+# Las sincronizaciones de la API corren en un hilo aparte y pueden coincidir
+# con un guardado del modo local: este lock protege el estado de arriba y la
+# escritura de los archivos de subgrupos.
+_LOCK = threading.RLock()
+
+
+def marcar_modificado(auto: dict) -> None:
+    """Anota los subgrupos de `auto` para la próxima sincronización incremental.
+
+    Debe llamarse al borrar un auto y antes y después de editarlo (si cambia
+    la marca, por ejemplo, se reescriben el archivo viejo y el nuevo).
+
+    Args:
+        auto (dict): Auto editado o borrado.
+    """
+    with _LOCK:
+        for subcarpeta, campo, defecto in CRITERIOS:
+            _grupos_modificados.add((subcarpeta, limpiar_nombre_archivo(auto.get(campo, defecto))))
+
+
+def _escribir_grupos(carpeta: Path, grupos: dict, claves=None) -> None:
+    """Escribe un CSV por grupo dentro de `carpeta` y borra los que quedaron vacíos.
+
+    Args:
+        carpeta (Path): Subcarpeta del criterio (ej.: 'subgrupos/por_marca').
+        grupos (dict[str, list[dict]]): Autos de cada grupo, por nombre de
+            archivo (sin '.csv', ver `limpiar_nombre_archivo`).
+        claves (set[str] | None): Grupos a reescribir. Si es None se
+            reescriben todos y se borran los archivos de grupos que ya no
+            tienen autos; si no, solo esos grupos (borrando los vacíos).
+    """
+    if claves is None:
+        a_escribir = grupos.keys()
+        sobrantes = [ruta.stem for ruta in carpeta.glob("*.csv")]
+    else:
+        a_escribir = [clave for clave in claves if clave in grupos]
+        sobrantes = claves
+
+    for clave in sobrantes:
+        if clave not in grupos:
+            (carpeta / (clave + ".csv")).unlink(missing_ok=True)
+
+    for clave in a_escribir:
+        ruta_archivo = carpeta / (clave + ".csv")
+        with open(ruta_archivo, "w", encoding="utf-8-sig", newline="") as f:
+            # csv.writer con tuplas: evita el dict intermedio de DictWriter por fila
+            writer = csv.writer(f)
+            writer.writerow(CAMPOS)
+            # Los tipos ya se validan al leer (Año es int); csv.writer convierte
+            # cada valor a texto, así que no hacen falta str()/int() por fila.
+            writer.writerows(
+                (a["Marca"], a["Modelo"], a["Año"], a["TipoCombustible"], a["Transmisión"])
+                for a in grupos[clave]
+            )
+
+
+def _organizar_por(autos: list[dict], ruta_db_central: str, subcarpeta: str, campo: str, defecto: str) -> None:
+    """Agrupa `autos` por un solo `campo` y escribe sus CSV en `subcarpeta`."""
+    grupos = defaultdict(list)
+    for auto in autos:
+        grupos[limpiar_nombre_archivo(auto.get(campo, defecto))].append(auto)
+    _escribir_grupos(obtener_ruta_subgrupos(ruta_db_central) / subcarpeta, grupos)
+
+
 def organizar_por_marca(autos: list[dict], ruta_db_central: str) -> None:
     """Organiza los autos en subcarpetas agrupados por marca.
 
@@ -80,34 +168,7 @@ def organizar_por_marca(autos: list[dict], ruta_db_central: str) -> None:
         autos (list[dict]): Lista de autos a organizar.
         ruta_db_central (str): Ruta del archivo CSV central.
     """
-    base_subgrupos = obtener_ruta_subgrupos(ruta_db_central)
-    carpeta_marca = base_subgrupos / "por_marca"
-
-    # Agrupar autos por marca
-    autos_por_marca = {}
-    for auto in autos:
-        marca = auto.get("Marca", "Desconocida")
-        if marca not in autos_por_marca:
-            autos_por_marca[marca] = []
-        autos_por_marca[marca].append(auto)
-
-    # Crear archivo CSV para cada marca
-    for marca, lista_autos in autos_por_marca.items():
-        nombre_archivo = limpiar_nombre_archivo(marca) + ".csv"
-        ruta_archivo = carpeta_marca / nombre_archivo
-
-        fieldnames = ["Marca", "Modelo", "Año", "TipoCombustible", "Transmisión"]
-        with open(ruta_archivo, "w", encoding="utf-8-sig", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for a in lista_autos:
-                writer.writerow({
-                    "Marca": str(a["Marca"]),
-                    "Modelo": str(a["Modelo"]),
-                    "Año": int(a["Año"]),
-                    "TipoCombustible": str(a["TipoCombustible"]),
-                    "Transmisión": str(a["Transmisión"]),
-                })
+    _organizar_por(autos, ruta_db_central, *CRITERIOS[0])
 
 
 def organizar_por_combustible(autos: list[dict], ruta_db_central: str) -> None:
@@ -119,34 +180,7 @@ def organizar_por_combustible(autos: list[dict], ruta_db_central: str) -> None:
         autos (list[dict]): Lista de autos a organizar.
         ruta_db_central (str): Ruta del archivo CSV central.
     """
-    base_subgrupos = obtener_ruta_subgrupos(ruta_db_central)
-    carpeta_combustible = base_subgrupos / "por_combustible"
-
-    # Agrupar autos por tipo de combustible
-    autos_por_combustible = {}
-    for auto in autos:
-        combustible = auto.get("TipoCombustible", "Desconocido")
-        if combustible not in autos_por_combustible:
-            autos_por_combustible[combustible] = []
-        autos_por_combustible[combustible].append(auto)
-
-    # Crear archivo CSV para cada tipo de combustible
-    for combustible, lista_autos in autos_por_combustible.items():
-        nombre_archivo = limpiar_nombre_archivo(combustible) + ".csv"
-        ruta_archivo = carpeta_combustible / nombre_archivo
-
-        fieldnames = ["Marca", "Modelo", "Año", "TipoCombustible", "Transmisión"]
-        with open(ruta_archivo, "w", encoding="utf-8-sig", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for a in lista_autos:
-                writer.writerow({
-                    "Marca": str(a["Marca"]),
-                    "Modelo": str(a["Modelo"]),
-                    "Año": int(a["Año"]),
-                    "TipoCombustible": str(a["TipoCombustible"]),
-                    "Transmisión": str(a["Transmisión"]),
-                })
+    _organizar_por(autos, ruta_db_central, *CRITERIOS[1])
 
 
 def organizar_por_transmision(autos: list[dict], ruta_db_central: str) -> None:
@@ -158,55 +192,115 @@ def organizar_por_transmision(autos: list[dict], ruta_db_central: str) -> None:
         autos (list[dict]): Lista de autos a organizar.
         ruta_db_central (str): Ruta del archivo CSV central.
     """
-    base_subgrupos = obtener_ruta_subgrupos(ruta_db_central)
-    carpeta_transmision = base_subgrupos / "por_transmision"
-
-    # Agrupar autos por transmisión
-    autos_por_transmision = {}
-    for auto in autos:
-        transmision = auto.get("Transmisión", "Desconocida")
-        if transmision not in autos_por_transmision:
-            autos_por_transmision[transmision] = []
-        autos_por_transmision[transmision].append(auto)
+    _organizar_por(autos, ruta_db_central, *CRITERIOS[2])
 
-    # Crear archivo CSV para cada transmisión
-    for transmision, lista_autos in autos_por_transmision.items():
-        nombre_archivo = limpiar_nombre_archivo(transmision) + ".csv"
-        ruta_archivo = carpeta_transmision / nombre_archivo
 
-        fieldnames = ["Marca", "Modelo", "Año", "TipoCombustible", "Transmisión"]
-        with open(ruta_archivo, "w", encoding="utf-8-sig", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for a in lista_autos:
-                writer.writerow({
-                    "Marca": str(a["Marca"]),
-                    "Modelo": str(a["Modelo"]),
-                    "Año": int(a["Año"]),
-                    "TipoCombustible": str(a["TipoCombustible"]),
-                    "Transmisión": str(a["Transmisión"]),
-                })
-
-
-def sincronizar_estructura_jerarquica(autos: list[dict], ruta_db_central: str) -> None:
+def sincronizar_estructura_jerarquica(autos: list[dict], ruta_db_central: str, incremental: bool = False) -> None:
     """Sincroniza la estructura jerárquica completa con los datos actuales.
 
     Esta función:
     1. Inicializa la estructura de carpetas si no existe
-    2. Organiza los datos en subcarpetas por marca, combustible y transmisión
-    3. Mantiene la sincronización entre el archivo central y los subgrupos
+    2. Agrupa los autos por marca, combustible y transmisión en una sola pasada
+    3. Escribe los CSV de cada subgrupo, manteniendo la sincronización entre
+       el archivo central y los subgrupos, y borra los de subgrupos vacíos
+
+    Con `incremental=True`, si `autos` es la misma lista de la sincronización
+    anterior, solo se reescriben los subgrupos anotados con
+    `marcar_modificado`; en cualquier otro caso se reescriben todos.
 
     Args:
         autos (list[dict]): Lista completa de autos desde el archivo central.
         ruta_db_central (str): Ruta del archivo CSV central.
+        incremental (bool): Si True, reescribe solo los subgrupos modificados.
     """
+    with _LOCK:
+        _sincronizar(autos, ruta_db_central, incremental)
+
+
+def _sincronizar(autos: list[dict], ruta_db_central: str, incremental: bool) -> None:
+    """Cuerpo de `sincronizar_estructura_jerarquica` (se llama con `_LOCK` tomado)."""
+    global _ultima_lista
     # Inicializar estructura si no existe
     inicializar_estructura_jerarquica(ruta_db_central)
+    base_subgrupos = obtener_ruta_subgrupos(ruta_db_central)
 
-    # Organizar datos en subgrupos jerárquicos
-    organizar_por_marca(autos, ruta_db_central)
-    organizar_por_combustible(autos, ruta_db_central)
-    organizar_por_transmision(autos, ruta_db_central)
+    modificados = set(_grupos_modificados)
+    if not (incremental and _ultima_lista is autos):
+        modificados = None
+
+    # Un solo recorrido de `autos` arma los tres agrupamientos a la vez. Se
+    # agrupa por nombre de archivo: valores que se limpian igual ("A/B" y
+    # "A-B") comparten archivo y se escriben juntos.
+    por_marca, por_combustible, por_transmision = (defaultdict(list) for _ in CRITERIOS)
+    for auto in autos:
+        por_marca[limpiar_nombre_archivo(auto.get("Marca", "Desconocida"))].append(auto)
+        por_combustible[limpiar_nombre_archivo(auto.get("TipoCombustible", "Desconocido"))].append(auto)
+        por_transmision[limpiar_nombre_archivo(auto.get("Transmisión", "Desconocida"))].append(auto)
+
+    carpetas = [base_subgrupos / subcarpeta for subcarpeta, _, _ in CRITERIOS]
+    agrupamientos = [por_marca, por_combustible, por_transmision]
+    claves = [
+        None if modificados is None
+        else {clave for sub, clave in modificados if sub == subcarpeta}
+        for subcarpeta, _, _ in CRITERIOS
+    ]
+
+    # Cada criterio escribe en su propia carpeta: se hacen en paralelo porque
+    # el tiempo se va casi todo en E/S de disco, que libera el GIL.
+    tareas = list(zip(carpetas, agrupamientos, claves))
+    futuros = []
+    with ThreadPoolExecutor(max_workers=len(CRITERIOS)) as ejecutor:
+        try:
+            for tarea in tareas:
+                futuros.append(ejecutor.submit(_escribir_grupos, *tarea))
+        except RuntimeError:
+            # Al cerrar el intérprete (p. ej. guardado en atexit) ya no se
+            # aceptan hilos nuevos: las carpetas que faltan se escriben acá
+            for tarea in tareas[len(futuros):]:
+                _escribir_grupos(*tarea)
+    for futuro in futuros:
+        futuro.result()
+
+    if modificados is None:
+        _grupos_modificados.clear()
+    else:
+        # Solo se olvidan las marcas que se escribieron en esta pasada
+        _grupos_modificados.difference_update(modificados)
+    _ultima_lista = autos
+
+
+def agregar_a_estructura_jerarquica(auto: dict, ruta_db_central: str) -> None:
+    """Agrega un auto nuevo a los CSV de sus subgrupos sin reescribirlos.
+
+    Abre en modo append el archivo de su marca, su combustible y su
+    transmisión. Si alguno no existe, lo crea con el encabezado.
+
+    Args:
+        auto (dict): Auto recién agregado al archivo central.
+        ruta_db_central (str): Ruta del archivo CSV central.
+    """
+    with _LOCK:
+        inicializar_estructura_jerarquica(ruta_db_central)
+        base_subgrupos = obtener_ruta_subgrupos(ruta_db_central)
+        # El auto puede no estar en la lista local (altas hechas desde la API):
+        # al guardar esa lista, sus subgrupos se reescriben a partir de ella.
+        marcar_modificado(auto)
+
+        destinos = [
+            (base_subgrupos / subcarpeta, auto.get(campo, defecto))
+            for subcarpeta, campo, defecto in CRITERIOS
+        ]
+
+        for carpeta, clave in destinos:
+            ruta_archivo = carpeta / (limpiar_nombre_archivo(clave) + ".csv")
+            nuevo = not ruta_archivo.exists() or ruta_archivo.stat().st_size == 0
+            with open(ruta_archivo, "a", encoding="utf-8-sig", newline="") as f:
+                writer = csv.writer(f)
+                if nuevo:
+                    writer.writerow(CAMPOS)
+                writer.writerow(
+                    (auto["Marca"], auto["Modelo"], auto["Año"], auto["TipoCombustible"], auto["Transmisión"])
+                )
 
 
 def leer_desde_subgrupo(ruta_subgrupo: str) -> list[dict]:
@@ -223,29 +317,21 @@ def leer_desde_subgrupo(ruta_subgrupo: str) -> list[dict]:
         return autos
 
     with open(ruta_subgrupo, "r", encoding="utf-8-sig", newline="") as f:
-        lector = csv.DictReader(f)
+        lector = csv.reader(f)
+        encabezado = next(lector, None)
+        if encabezado is None:
+            return autos
+
+        # Las columnas se ubican una sola vez a partir del encabezado (ver
+        # `tools.posiciones_columnas`); cada fila se lee por posición.
+        indices = tools.posiciones_columnas(tuple(encabezado))
+        if indices is None:
+            return autos
+
         for fila in lector:
-            marca = fila.get("Marca") or fila.get("marca")
-            modelo = fila.get("Modelo") or fila.get("modelo")
-            año = fila.get("Año") or fila.get("Año") or fila.get("año")
-            tipo_combustible = fila.get("TipoCombustible") or fila.get("tipoCombustible") or fila.get("tipocombustible")
-            transmision = fila.get("Transmisión") or fila.get("transmisión") or fila.get("transmision") or fila.get("Transmision")
-
-            if not (marca and modelo and año and tipo_combustible and transmision):
-                continue
-
-            try:
-                año_int = int(float(año))
-            except (TypeError, ValueError):
-                continue
-
-            autos.append({
-                "Marca": marca.strip(),
-                "Modelo": modelo.strip(),
-                "Año": año_int,
-                "TipoCombustible": tipo_combustible.strip(),
-                "Transmisión": transmision.strip(),
-            })
+            auto = tools.auto_desde_fila(fila, indices)
+            if auto is not None:
+                autos.append(auto)
 
     return autos
 
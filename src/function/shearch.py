@@ -7,20 +7,27 @@ Este módulo proporciona funciones para buscar y filtrar autos por diferentes cr
 - Filtro por transmisión
 """
 
-import csv
 from function.tools import *
 from function.view import *
+from function.columnas import (
+    posiciones_en_rango_año,
+    posiciones_marca_o_modelo,
+    posiciones_que_contienen,
+)
 
 
 def buscar_auto_recursivo(autos, busqueda, indice=0, encontrados=None):
-    """Busca autos de forma recursiva por marca o modelo.
+    """Busca autos por marca o modelo a partir de la posición `indice`.
 
-    Implementación recursiva para cumplir con los requisitos del proyecto.
+    Antes se resolvía con una llamada recursiva por auto, lo que superaba el
+    límite de recursión de Python con listas de más de ~1000 autos. Ahora es
+    una búsqueda sobre el texto de marcas y modelos normalizados (ver
+    `columnas.posiciones_marca_o_modelo`); se conservan nombre y firma.
 
     Args:
         autos (list[dict]): Lista de autos donde buscar.
         busqueda (str): Texto a buscar en Marca o Modelo.
-        indice (int): Índice actual en la lista (para recursión).
+        indice (int): Posición desde la que se empieza a buscar.
         encontrados (list[dict]): Lista acumulativa de resultados.
 
     Returns:
@@ -29,21 +36,12 @@ def buscar_auto_recursivo(autos, busqueda, indice=0, encontrados=None):
     if encontrados is None:
         encontrados = []
 
-    # Caso base: se recorrió toda la lista
-    if indice >= len(autos):
-        return encontrados
-
-    # Procesar el elemento actual
-    auto_actual = autos[indice]
-    busqueda_norm = normalizar(busqueda)
-    marca_norm = normalizar(auto_actual.get("Marca", ""))
-    modelo_norm = normalizar(auto_actual.get("Modelo", ""))
-
-    if busqueda_norm in marca_norm or busqueda_norm in modelo_norm:
-        encontrados.append(auto_actual)
-
-    # Llamada recursiva para el siguiente elemento
-    return buscar_auto_recursivo(autos, busqueda, indice + 1, encontrados)
+    encontrados.extend(
+        autos[i]
+        for i in posiciones_marca_o_modelo(autos, normalizar(busqueda))
+        if i >= indice
+    )
+    return encontrados
 
 
 def _leer_entero_no_negativo(respuesta: str):
@@ -53,7 +51,7 @@ def _leer_entero_no_negativo(respuesta: str):
     - entero no negativo
     Devuelve int o None si es inválido.
     """
-    s = input(respuesta).strip()
+    s = leer(respuesta).strip()
     if not s.isdigit():
         print("Ingrese solo números enteros no negativos (sin espacios ni letras).")
         return None
@@ -63,7 +61,8 @@ def _leer_entero_no_negativo(respuesta: str):
 def buscar_auto(autos, busqueda):
     """Busca autos por marca o modelo.
 
-    Esta función utiliza la implementación recursiva internamente.
+    Compara contra las columnas de marca y modelo ya normalizadas (ver
+    `function.columnas`), que se calculan una sola vez por lista.
 
     Args:
         autos (list[dict]): Lista de autos donde buscar.
@@ -72,7 +71,6 @@ def buscar_auto(autos, busqueda):
     Returns:
         None (imprime resultados por consola).
     """
-    # Usar búsqueda recursiva
     encontrados = buscar_auto_recursivo(autos, busqueda)
 
     if encontrados:
@@ -100,10 +98,7 @@ def filtrar_combustible(autos, tipo_combustible):
         None (imprime resultados por consola).
     """
     tipo_norm = normalizar(tipo_combustible)
-    resultados = [
-        a for a in autos
-        if tipo_norm in normalizar(a["TipoCombustible"])
-    ]
+    resultados = [autos[i] for i in posiciones_que_contienen(autos, "TipoCombustible", tipo_norm)]
     if resultados:
         print(f"\n Autos con tipo de combustible '{tipo_combustible}':")
         mostrar_autos(resultados)
@@ -134,10 +129,7 @@ def filtrar_año(autos):
         print("El mínimo no puede ser mayor que el máximo.")
         return
 
-    resultado = [
-        a for a in autos
-        if minimo <= a.get('Año', -1) <= maximo
-    ]
+    resultado = [autos[i] for i in posiciones_en_rango_año(autos, minimo, maximo)]
 
     if resultado:
         print(f"\nAutos con año entre {minimo} y {maximo}:")
@@ -157,10 +149,7 @@ def filtrar_transmision(autos, transmision):
         None (imprime resultados por consola).
     """
     transmision_norm = normalizar(transmision)
-    resultados = [
-        a for a in autos
-        if transmision_norm in normalizar(a["Transmisión"])
-    ]
+    resultados = [autos[i] for i in posiciones_que_contienen(autos, "Transmisión", transmision_norm)]
     if resultados:
         print(f"\n Autos con transmisión '{transmision}':")
         mostrar_autos(resultados)
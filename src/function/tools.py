@@ -3,18 +3,31 @@
 Incluye:
 - Normalización de texto (elimina acentos, espacios extremos y pasa a minúsculas).
 - Lectura y escritura de autos en CSV.
-- Ayudas de consola (limpiar pantalla, menús, mensajes y errores).
+- Ayudas de consola (lectura de entrada, limpiar pantalla, menús, mensajes y errores).
 """
 
 import unicodedata
 import csv
+import functools
 import os
+import re
+import sys
 
 
+# Bloques Unicode de marcas diacríticas combinantes (tildes, diéresis, etc.).
+# Tras la descomposición NFD, quitarlos con una sola pasada del regex deja el
+# texto sin acentos.
+_MARCAS_COMBINANTES = re.compile('[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]')
+
+
+@functools.lru_cache(maxsize=8192)
 def normalizar(texto):
     """Devuelve el texto en minúsculas, sin espacios extremos ni acentos.
 
-    Usa normalización Unicode (NFD) para remover marcas diacríticas.
+    Usa normalización Unicode (NFD) y un regex para remover las marcas
+    diacríticas combinantes. Los resultados se memorizan: los valores
+    repetidos de los campos (por ejemplo "Manual" o "Nafta") se normalizan
+    una sola vez.
 
     Args:
         texto (str): Cadena de entrada.
@@ -23,12 +36,77 @@ def normalizar(texto):
         str: Texto normalizado en minúsculas y sin acentos.
     """
     texto = texto.lower().strip()
-    texto = unicodedata.normalize('NFD', texto)
-    texto = ''.join(c for c in texto if unicodedata.category(c) != 'Mn')
-    return texto
+    if texto.isascii():
+        # Sin caracteres fuera de ASCII no hay acentos que quitar
+        return texto
+    return _MARCAS_COMBINANTES.sub('', unicodedata.normalize('NFD', texto))
+
+
+# Nombres de las columnas del CSV ya normalizados, en el orden estándar
+# (Marca, Modelo, Año, TipoCombustible, Transmisión).
+_COLUMNAS_NORMALIZADAS = ("marca", "modelo", "ano", "tipocombustible", "transmision")
+
+
+@functools.cache
+def posiciones_columnas(encabezado: tuple[str, ...]) -> tuple[int, ...] | None:
+    """Ubica las columnas estándar dentro de un encabezado de CSV.
+
+    Los nombres se comparan normalizados, así que "Año", "año" o "Transmision"
+    se reconocen igual. El resultado se memoriza por encabezado: todos los
+    archivos con el mismo encabezado lo resuelven una sola vez.
+
+    Args:
+        encabezado (tuple[str, ...]): Primera fila del CSV.
+
+    Returns:
+        tuple[int, ...] | None: Posición de Marca, Modelo, Año, TipoCombustible
+        y Transmisión, o None si falta alguna de esas columnas.
+    """
+    posicion = {normalizar(nombre): i for i, nombre in enumerate(encabezado)}
+    if not all(nombre in posicion for nombre in _COLUMNAS_NORMALIZADAS):
+        return None
+    return tuple(posicion[nombre] for nombre in _COLUMNAS_NORMALIZADAS)
 
 
-def leer_csv(ruta_csv: str):
+def auto_desde_fila(fila: list[str], indices: tuple[int, ...]) -> dict | None:
+    """Arma el dict de un auto a partir de una fila de CSV.
+
+    Args:
+        fila (list[str]): Fila tal como la devuelve `csv.reader`.
+        indices (tuple[int, ...]): Posiciones de las columnas, según
+            `posiciones_columnas`.
+
+    Returns:
+        dict | None: Auto con `Año` como int, o None si a la fila le faltan
+        datos o el año no es numérico.
+    """
+    try:
+        marca, modelo, año, tipo_combustible, transmision = (fila[i] for i in indices)
+    except IndexError:
+        return None
+
+    # Validación básica de presencia
+    if not (marca and modelo and año and tipo_combustible and transmision):
+        return None
+
+    # Parseos numéricos tolerantes
+    try:
+        año_int = int(float(año))
+    except (TypeError, ValueError):
+        return None
+
+    # Marca, combustible y transmisión se repiten en muchas filas:
+    # `sys.intern` hace que todas compartan una sola copia del texto.
+    return {
+        "Marca": sys.intern(marca.strip()),
+        "Modelo": modelo.strip(),
+        "Año": año_int,
+        "TipoCombustible": sys.intern(tipo_combustible.strip()),
+        "Transmisión": sys.intern(transmision.strip()),
+    }
+
+
+def leer_csv(ruta_csv: str, avisos: list[str] | None = None):
     """Lee un CSV de autos y devuelve una lista de dicts.
 
     La función es tolerante a encabezados alternativos. Si encuentra
@@ -45,6 +123,9 @@ def leer_csv(ruta_csv: str):
 
     Args:
         ruta_csv (str): Ruta al archivo CSV con codificación UTF-8 (BOM ok).
+        avisos (list[str] | None): Si se indica, los avisos se agregan a esta
+            lista en lugar de imprimirse (útil al leer en segundo plano, para
+            mostrarlos después sin mezclarlos con otra salida).
 
     Returns:
         list[dict]: Lista de autos válidos leídos del archivo.
@@ -53,49 +134,45 @@ def leer_csv(ruta_csv: str):
     filas_invalidas = 0
 
     with open(ruta_csv, "r", encoding="utf-8-sig", newline="") as f:
-        lector = csv.DictReader(f)
+        lector = csv.reader(f)
+        encabezado = next(lector, [])
+
+        # Las columnas se ubican una sola vez a partir del encabezado; cada
+        # fila se lee por posición.
+        indices = posiciones_columnas(tuple(encabezado))
+
         for fila in lector:
-            marca = fila.get("Marca") or fila.get("marca")
-            modelo = fila.get("Modelo") or fila.get("modelo")
-            año = fila.get("Año") or fila.get("Año") or fila.get("año")
-            tipo_combustible = fila.get("TipoCombustible") or fila.get("tipoCombustible") or fila.get("tipocombustible")
-            transmision = fila.get("Transmisión") or fila.get("transmisión") or fila.get("transmision") or fila.get("Transmision")
-
-            # Validación básica de presencia
-            if not (marca and modelo and año and tipo_combustible and transmision):
-                filas_invalidas += 1
+            if not fila:
+                # Línea en blanco: se ignora sin contarla como inválida
                 continue
-
-            # Parseos numéricos tolerantes
-            try:
-                año_int = int(float(año))
-            except (TypeError, ValueError):
+            auto = auto_desde_fila(fila, indices) if indices is not None else None
+            if auto is None:
                 filas_invalidas += 1
                 continue
+            autos.append(auto)
 
-            autos.append({
-                "Marca": marca.strip(),
-                "Modelo": modelo.strip(),
-                "Año": año_int,
-                "TipoCombustible": tipo_combustible.strip(),
-                "Transmisión": transmision.strip(),
-            })
-
+    mensajes = []
     if filas_invalidas:
-        print("***************************************************************************************")
-        print(f"🛑 Se ignoraron {filas_invalidas} fila(s) inválida(s) en {ruta_csv}. archivo dañado")
+        mensajes.append("***************************************************************************************")
+        mensajes.append(f"🛑 Se ignoraron {filas_invalidas} fila(s) inválida(s) en {ruta_csv}. archivo dañado")
     if not autos:
-        print("🧐 CSV leído, pero no se obtuvieron filas válidas, csv corrupto o dañado")
-        print("No tendra datos iterables, cuando cargue un auto se creara una base datos nueva")
-        print("****************************************************************************************")
+        mensajes.append("🧐 CSV leído, pero no se obtuvieron filas válidas, csv corrupto o dañado")
+        mensajes.append("No tendra datos iterables, cuando cargue un auto se creara una base datos nueva")
+        mensajes.append("****************************************************************************************")
+    if avisos is None:
+        for mensaje in mensajes:
+            print(mensaje)
+    else:
+        avisos.extend(mensajes)
     return autos
 
 
-def escribir_csv(ruta_csv: str, autos: list[dict]) -> None:
+def escribir_csv(ruta_csv: str, autos: list[dict], incremental: bool = False) -> None:
     """Escribe la lista de autos en un CSV con encabezado estándar.
 
     El archivo se crea/sobrescribe usando UTF-8 con BOM y las columnas:
-    'Marca', 'Modelo', 'Año', 'TipoCombustible', 'Transmisión'.
+    'Marca', 'Modelo', 'Año', 'TipoCombustible', 'Transmisión'. El reemplazo
+    es atómico (archivo temporal + `os.replace`).
 
     Además, sincroniza la estructura jerárquica de subgrupos organizando
     los datos en subcarpetas por marca, combustible y transmisión.
@@ -103,35 +180,108 @@ def escribir_csv(ruta_csv: str, autos: list[dict]) -> None:
     Args:
         ruta_csv (str): Ruta destino del archivo CSV.
         autos (list[dict]): Lista de autos a persistir.
+        incremental (bool): Si True, en los subgrupos se reescriben solo los
+            archivos afectados por ediciones y bajas (ver
+            `jerarquia.sincronizar_estructura_jerarquica`).
 
     Returns:
         None
     """
     fieldnames = ["Marca", "Modelo", "Año", "TipoCombustible", "Transmisión"]
-    with open(ruta_csv, "w", encoding="utf-8-sig", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for a in autos:
-            writer.writerow({
-                "Marca": str(a["Marca"]),
-                "Modelo": str(a["Modelo"]),
-                "Año": int(a["Año"]),
-                "TipoCombustible": str(a["TipoCombustible"]),
-                "Transmisión": str(a["Transmisión"]),
-            })
-
-    # Sincronizar estructura jerárquica después de escribir el archivo central
+    # Se escribe en un archivo temporal y se lo renombra al final: si algo
+    # falla a mitad de camino, el CSV anterior queda intacto.
+    ruta_tmp = ruta_csv + ".tmp"
     try:
-        from function.jerarquia import sincronizar_estructura_jerarquica
-        sincronizar_estructura_jerarquica(autos, ruta_csv)
-    except ImportError:
-        # Si el módulo jerarquia no está disponible, continuar sin sincronización
-        pass
+        with open(ruta_tmp, "w", buffering=1 << 20, encoding="utf-8-sig", newline="") as f:
+            # Los autos ya tienen los tipos correctos (texto y `Año` int): se
+            # pasan tal cual a `writerows`, sin casts por fila. Claves extra
+            # (como el `id` de la API) se ignoran.
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(autos)
+        os.replace(ruta_tmp, ruta_csv)
+    except BaseException:
+        if os.path.exists(ruta_tmp):
+            os.remove(ruta_tmp)
+        raise
+
+    # Sincronizar estructura jerárquica después de escribir el archivo central.
+    # Se importa acá porque `jerarquia` a su vez importa este módulo.
+    from function.jerarquia import sincronizar_estructura_jerarquica
+    sincronizar_estructura_jerarquica(autos, ruta_csv, incremental)
+
+
+def append_csv(ruta_csv: str, auto: dict) -> None:
+    """Agrega un único auto al final del CSV sin reescribir el archivo.
+
+    Si el archivo está vacío se escribe primero el encabezado estándar. La
+    estructura jerárquica se actualiza agregando la fila solo en los
+    subgrupos que corresponden al auto.
+
+    Args:
+        ruta_csv (str): Ruta del archivo CSV central.
+        auto (dict): Auto a agregar con las claves del CSV.
+
+    Returns:
+        None
+    """
+    fieldnames = ["Marca", "Modelo", "Año", "TipoCombustible", "Transmisión"]
+    nuevo = not os.path.exists(ruta_csv) or os.path.getsize(ruta_csv) == 0
+    with open(ruta_csv, "a", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        if nuevo:
+            writer.writeheader()
+        writer.writerow(auto)
+
+    from function.jerarquia import agregar_a_estructura_jerarquica
+    agregar_a_estructura_jerarquica(auto, ruta_csv)
+
+
+def leer(mensaje=""):
+    """Muestra `mensaje` y lee una línea de la entrada estándar (como `input`).
+
+    El mensaje se escribe con un solo `flush` y la línea se toma de
+    `sys.stdin`, que ya lee con buffer cuando la entrada viene de un archivo
+    o un pipe.
+
+    Args:
+        mensaje (str): Texto a mostrar antes de leer.
+
+    Returns:
+        str: Línea leída, sin el salto de línea final.
+
+    Raises:
+        EOFError: Si la entrada terminó, igual que `input`.
+    """
+    sys.stdout.write(mensaje)
+    sys.stdout.flush()
+    linea = sys.stdin.readline()
+    if not linea:
+        raise EOFError
+    return linea.rstrip("\r\n")
+
+
+# Secuencia ANSI/VT100: cursor al inicio, borrar pantalla y el historial.
+_ANSI_LIMPIAR = "\x1b[H\x1b[2J\x1b[3J"
+_vt_habilitado = False
 
 
 def limpiar_consola():
-    """Limpia la consola según el sistema operativo (cls/clear)."""
-    os.system("cls" if os.name == "nt" else "clear")
+    """Limpia la consola escribiendo la secuencia ANSI de borrado.
+
+    No lanza un proceso `cls`/`clear` en cada llamada. En Windows, la primera
+    vez se ejecuta `os.system("")`, que activa el soporte de secuencias VT en
+    la consola. Si la salida no es una terminal (por ejemplo, redirigida a un
+    archivo) no se escribe nada.
+    """
+    global _vt_habilitado
+    if not sys.stdout.isatty():
+        return
+    if os.name == "nt" and not _vt_habilitado:
+        os.system("")
+        _vt_habilitado = True
+    sys.stdout.write(_ANSI_LIMPIAR)
+    sys.stdout.flush()
 
 
 def salida():
@@ -177,14 +327,14 @@ def seleccion():
         int: 1 para CSV local, 2 para API, 3 para salir.
 
     Nota:
-        Esta función no maneja ValueError de `int(input(...))`. Se espera que
+        Esta función no maneja ValueError de `int(leer(...))`. Se espera que
         el llamador capture la excepción si el usuario ingresa texto inválido.
     """
     print("****Seleccione el servidor****")
     print("1. CSV local 💻")
     print("2. CSV  API  ☁️")
     print("3. Salir 🛑")
-    op = int(input("Elegí 1 o 2 : "))
+    op = int(leer("Elegí 1 o 2 : "))
     return op
 
 
@@ -192,10 +342,10 @@ def menu_principal():
     """Muestra el menú principal de operaciones y devuelve la opción elegida.
 
     Returns:
-        int: Número de opción (1 a 11).
+        int: Número de opción (1 a 12).
 
     Nota:
-        Esta función no maneja ValueError de `int(input(...))`. Se espera que
+        Esta función no maneja ValueError de `int(leer(...))`. Se espera que
         el llamador capture la excepción si el usuario ingresa texto inválido.
     """
     print("")
@@ -210,9 +360,10 @@ def menu_principal():
     print("8.  Editar un auto")
     print("9.  Borrar auto")
     print("10. Cambiar modo de servidor")
-    print("11. Salir")
+    print("11. Agregar varios autos")
+    print("12. Salir")
 
-    opcion = int(input("Ingrese una opcion 1-11: "))
+    opcion = int(leer("Ingrese una opcion 1-12: "))
     print("***********************************")
     return opcion
 
@@ -225,7 +376,7 @@ def error_tipeo_menu(opcion):
     """
     print("*******************🛑*************************")
     print(f"*🫣  Opcion incorrecta: ingresaste {opcion}  ")
-    print("*😁 Recuerda ingresar un numero del 1 al 11   ")
+    print("*😁 Recuerda ingresar un numero del 1 al 12   ")
     print("*******************🛑*************************")
 
 
@@ -241,7 +392,7 @@ def except_men_principal():
     """Mensaje de error cuando la opción del menú principal no es numérica."""
     print("***********************🛑*******************************")
     print("*🤔 Opcion incorrecta: No ingresaste un numero valido  *")
-    print("*😁      Recuerda ingresar un numero del 1 al 11       *")
+    print("*😁      Recuerda ingresar un numero del 1 al 12       *")
     print("***********************🛑*******************************")
 
 
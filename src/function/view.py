@@ -6,41 +6,25 @@ Incluye funciones para:
 - Ordenar listas de autos por marca, modelo, año, tipo de combustible o transmisión.
 """
 
-import csv  # (opcional: se podría eliminar si no se usa)
-from function.tools import normalizar
-import unicodedata  # (opcional: no se usa aquí directamente)
+from function.tools import normalizar, leer
+from function.columnas import obtener_tabla, columna_normalizada
 
 
-def mostrar_autos_recursivo(lista_autos, indice=0):
-    """Muestra los autos de forma recursiva.
-
-    Implementación recursiva para cumplir con los requisitos del proyecto.
-
-    Args:
-        lista_autos (list[dict]): Lista de autos a mostrar.
-        indice (int): Índice actual en la lista (para recursión).
-    """
-    # Caso base: se recorrió toda la lista
-    if indice >= len(lista_autos):
-        return
-
-    # Procesar el elemento actual
-    a = lista_autos[indice]
-    print(
+def _linea_auto(a):
+    """Arma la línea de consola con los datos principales de un auto."""
+    return (
         f"{a['Marca']} {a['Modelo']} | "
         f"Año: {a['Año']} | "
         f"Combustible: {a['TipoCombustible']} | "
         f"Transmisión: {a['Transmisión']}"
     )
 
-    # Llamada recursiva para el siguiente elemento
-    mostrar_autos_recursivo(lista_autos, indice + 1)
-
 
 def mostrar_autos(lista_autos):
     """Imprime una lista de autos con sus datos principales.
 
-    Esta función utiliza la implementación recursiva internamente.
+    Las líneas se arman en un solo texto y se imprimen con un único `print`,
+    sin recursión: funciona igual con listas de miles de autos.
 
     Cada elemento de `lista_autos` debe ser un diccionario con las claves:
     'Marca', 'Modelo', 'Año', 'TipoCombustible', 'Transmisión'.
@@ -54,14 +38,29 @@ def mostrar_autos(lista_autos):
     if not lista_autos:
         return
 
-    # Usar función recursiva
-    mostrar_autos_recursivo(lista_autos)
+    print("\n".join(map(_linea_auto, lista_autos)))
+
+
+def mostrar_autos_iterable(autos):
+    """Imprime autos a medida que los entrega un iterable (por ejemplo, un generador).
+
+    A diferencia de `mostrar_autos`, no necesita una lista: cada auto se
+    imprime apenas llega, sin guardar el resultado completo en memoria.
+
+    Args:
+        autos (Iterable[dict]): Autos a mostrar.
+
+    Returns:
+        None
+    """
+    for a in autos:
+        print(_linea_auto(a))
 
 
 def pedir_rango(nombre_campo):
     """Solicita por consola un rango (mínimo y máximo) para un campo numérico.
 
-    Muestra dos `input()`: uno para el mínimo y otro para el máximo. Si el
+    Muestra dos `leer()`: uno para el mínimo y otro para el máximo. Si el
     usuario ingresa un valor no numérico, informa el error y devuelve
     `(None, None)`.
 
@@ -73,8 +72,8 @@ def pedir_rango(nombre_campo):
         en caso de error, `(None, None)`.
     """
     try:
-        minimo = int(input(f"Ingresá {nombre_campo} mínimo: "))
-        maximo = int(input(f"Ingresá {nombre_campo} máximo: "))
+        minimo = int(leer(f"Ingresá {nombre_campo} mínimo: "))
+        maximo = int(leer(f"Ingresá {nombre_campo} máximo: "))
         return minimo, maximo
     except ValueError:
         print("Entrada inválida. Debés ingresar números.")
@@ -82,6 +81,18 @@ def pedir_rango(nombre_campo):
         return None, None
 
 
+# Subcadena del campo pedido (ya normalizado: sin acentos y en minúsculas)
+# → columna por la que se ordena. El orden de las claves es la prioridad.
+_CAMPOS_ORDEN = {
+    "marca": "Marca",
+    "modelo": "Modelo",
+    "ano": "Año",
+    "combustible": "TipoCombustible",
+    "tipo": "TipoCombustible",
+    "transmision": "Transmisión",
+}
+
+
 def ordenar_autos(autos, campo, descendente=False):
     """Ordena e imprime autos por 'Marca', 'Modelo', 'Año', 'TipoCombustible' o 'Transmisión'.
 
@@ -103,44 +114,29 @@ def ordenar_autos(autos, campo, descendente=False):
     Returns:
         None
     """
-    try:
-        campo_norm = normalizar(campo)
-
-        if "marca" in campo_norm:
-            campo_orden = "Marca"
-        elif "modelo" in campo_norm:
-            campo_orden = "Modelo"
-        elif "año" in campo_norm or "ano" in campo_norm:
-            campo_orden = "Año"
-        elif "combustible" in campo_norm or "tipo" in campo_norm:
-            campo_orden = "TipoCombustible"
-        elif "transmision" in campo_norm:
-            campo_orden = "Transmisión"
-        else:
-            print("Campo inválido para ordenar. Usá: marca / modelo / año / tipocombustible / transmision.")
-            return
-
-        if campo_orden in ["Marca", "Modelo", "TipoCombustible", "Transmisión"]:
-            autos_ordenados = sorted(
-                autos,
-                key=lambda x: normalizar(str(x[campo_orden])),
-                reverse=descendente,
-            )
-        elif campo_orden == "Año":
-            autos_ordenados = sorted(
-                autos,
-                key=lambda x: x[campo_orden],
-                reverse=descendente,
-            )
-        else:
-            print("Campo inválido para ordenar.")
-            return
-
-        print(
-            f"\nAutos ordenados por {campo_orden} "
-            f"({'descendente' if descendente else 'ascendente'}):"
-        )
-        mostrar_autos(autos_ordenados)
-
-    except Exception as e:
-        print(f"Error al ordenar: {e}")
+    campo_norm = normalizar(campo)
+
+    # Gana la primera subcadena de `_CAMPOS_ORDEN` presente en el texto.
+    campo_orden = next(
+        (columna for subcadena, columna in _CAMPOS_ORDEN.items() if subcadena in campo_norm),
+        None,
+    )
+    if campo_orden is None:
+        print("Campo inválido para ordenar. Usá: marca / modelo / año / tipocombustible / transmision.")
+        return
+
+    # Se ordenan las posiciones según la columna del campo elegido y
+    # luego se arma la lista de autos en ese orden.
+    if campo_orden == "Año":
+        claves = obtener_tabla(autos)["Año"]
+    else:
+        claves = columna_normalizada(autos, campo_orden)
+
+    orden = sorted(range(len(autos)), key=claves.__getitem__, reverse=descendente)
+    autos_ordenados = [autos[i] for i in orden]
+
+    print(
+        f"\nAutos ordenados por {campo_orden} "
+        f"({'descendente' if descendente else 'ascendente'}):"
+    )
+    mostrar_autos(autos_ordenados)